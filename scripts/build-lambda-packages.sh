@@ -18,6 +18,11 @@ SRC_DIR="$PROJECT_ROOT/src"
 BUILD_DIR="$PROJECT_ROOT/build"
 DEPLOYMENT_DIR="$PROJECT_ROOT/deployment"
 
+# Lambda target for binary dependencies; override for arm64 (manylinux2014_aarch64)
+# or another runtime version
+LAMBDA_PLATFORM="${LAMBDA_PLATFORM:-manylinux2014_x86_64}"
+LAMBDA_PYTHON_VERSION="${LAMBDA_PYTHON_VERSION:-3.13}"
+
 # Lambda function configurations matching Terraform
 # Fixed: Use proper associative array declaration
 declare -A LAMBDA_FUNCTIONS
@@ -44,13 +49,31 @@ echo -e "${YELLOW}📦 Installing Python dependencies...${NC}"
 mkdir -p "$DEPS_DIR"
 
 if [ -f "$SRC_DIR/requirements.txt" ]; then
-    pip install -r "$SRC_DIR/requirements.txt" -t "$DEPS_DIR" --quiet
+    # orjson is a native wheel: resolve wheels for the Lambda platform, not the
+    # build machine, so a macOS or ARM build doesn't ship one Lambda can't load.
+    # Defaults match template.yaml and the Terraform lambda module (python3.13, x86_64)
+    echo "  🎯 Target: ${LAMBDA_PLATFORM} / Python ${LAMBDA_PYTHON_VERSION}"
+    pip install -r "$SRC_DIR/requirements.txt" -t "$DEPS_DIR" --quiet \
+        --platform "$LAMBDA_PLATFORM" \
+        --python-version "$LAMBDA_PYTHON_VERSION" \
+        --implementation cp \
+        --only-binary=:all:
     echo -e "${GREEN}✅ Dependencies installed successfully${NC}"
 else
     echo -e "${RED}❌ requirements.txt not found in $SRC_DIR${NC}"
     exit 1
 fi
 
+# The Lambda Python runtime already ships the AWS SDK and its dependencies;
+# bundling them again only makes the packages bigger and cold starts slower
+RUNTIME_PROVIDED_PACKAGES="boto3 botocore s3transfer jmespath dateutil python_dateutil six urllib3"
+echo -e "${YELLOW}✂️  Pruning runtime-provided packages...${NC}"
+for package in $RUNTIME_PROVIDED_PACKAGES; do
+    rm -rf "$DEPS_DIR/$package" "$DEPS_DIR/$package"-*.dist-info
+done
+rm -f "$DEPS_DIR/six.py"
+rm -rf "$DEPS_DIR/bin"
+
 # Function to get file size in bytes (macOS compatible)
 get_file_size_bytes() {
     local file="$1"
@@ -5,9 +5,13 @@ This script tests the connection to DynamoDB Local and verifies table setup
 """
 
 import boto3
+import io
 import json
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
 from botocore.exceptions import ClientError, EndpointConnectionError, NoCredentialsError
 
 # Colors for output
@@ -19,54 +23,97 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
+# Table names shown by the connection test
+MAX_LISTED_TABLES = 10
+
+# Tests run concurrently; each one writes to its own buffer so output
+# can be replayed in order once they finish
+_output = threading.local()
+
+def _out():
+    """Return the current test's output buffer, or stdout outside the suite"""
+    return getattr(_output, 'buffer', sys.stdout)
+
+# Color prefixes are built once; each helper then issues a single write
+_SUCCESS_PREFIX = f"{Colors.GREEN}✓ "
+_ERROR_PREFIX = f"{Colors.RED}✗ "
+_WARNING_PREFIX = f"{Colors.YELLOW}⚠ "
+_INFO_PREFIX = f"{Colors.BLUE}ℹ "
+_LINE_END = f"{Colors.END}\n"
+_HEADER_RULE = f"{Colors.BOLD}{Colors.BLUE}{'='*50}{Colors.END}"
+
 def print_success(text: str) -> None:
     """Print success message"""
-    print(f"{Colors.GREEN}✓ {text}{Colors.END}")
+    _out().write(f"{_SUCCESS_PREFIX}{text}{_LINE_END}")
 
 def print_error(text: str) -> None:
     """Print error message"""
-    print(f"{Colors.RED}✗ {text}{Colors.END}")
+    _out().write(f"{_ERROR_PREFIX}{text}{_LINE_END}")
 
 def print_warning(text: str) -> None:
     """Print warning message"""
-    print(f"{Colors.YELLOW}⚠ {text}{Colors.END}")
+    _out().write(f"{_WARNING_PREFIX}{text}{_LINE_END}")
 
 def print_info(text: str) -> None:
     """Print info message"""
-    print(f"{Colors.BLUE}ℹ {text}{Colors.END}")
+    _out().write(f"{_INFO_PREFIX}{text}{_LINE_END}")
 
 def print_header(text: str) -> None:
     """Print a formatted header"""
-    print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*50}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{text.center(50)}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{'='*50}{Colors.END}")
-
-def test_dynamodb_connection(endpoint_url: str = "http://localhost:8000",
-                           region: str = "us-east-1") -> bool:
+    _out().write(f"\n{_HEADER_RULE}\n"
+                 f"{Colors.BOLD}{Colors.BLUE}{text.center(50)}{Colors.END}\n"
+                 f"{_HEADER_RULE}\n")
+
+# describe_table results shared by the structure and GSI tests
+_table_descriptions = {}
+_table_descriptions_lock = threading.Lock()
+
+def describe_table(dynamodb, table_name: str) -> dict:
+    """Describe a table once per run; concurrent callers wait for and share the result"""
+    with _table_descriptions_lock:
+        if table_name not in _table_descriptions:
+            response = dynamodb.describe_table(TableName=table_name)
+            _table_descriptions[table_name] = response['Table']
+        return _table_descriptions[table_name]
+
+# Adaptive retries back off on throttling so a busy shared DynamoDB Local
+# (e.g. parallel CI jobs) doesn't make the suite flaky
+_CLIENT_CONFIG = Config(retries={'max_attempts': 10, 'mode': 'adaptive'})
+# The connection probe fails fast instead of backing off against a dead endpoint
+_PROBE_CONFIG = Config(retries={'max_attempts': 1, 'mode': 'standard'})
+
+def create_client(endpoint_url: str = "http://localhost:8000",
+                  region: str = "us-east-1",
+                  config: Config = _CLIENT_CONFIG):
+    """Create the DynamoDB client shared by all tests (clients are thread-safe)"""
+    return boto3.session.Session().client(
+        'dynamodb',
+        endpoint_url=endpoint_url,
+        region_name=region,
+        aws_access_key_id='local',
+        aws_secret_access_key='local',
+        config=config
+    )
+
+def test_dynamodb_connection(dynamodb, endpoint_url: str = "http://localhost:8000") -> bool:
     """Test basic DynamoDB connection"""
     print_header("DYNAMODB CONNECTION TEST")
 
     try:
-        # Create DynamoDB client
-        dynamodb = boto3.client(
-            'dynamodb',
-            endpoint_url=endpoint_url,
-            region_name=region,
-            aws_access_key_id='local',
-            aws_secret_access_key='local'
-        )
-
         print_info(f"Testing connection to {endpoint_url}...")
 
-        # Try to list tables
-        response = dynamodb.list_tables()
+        # Try to list tables; one bounded page is enough for a connectivity check
+        response = dynamodb.list_tables(Limit=MAX_LISTED_TABLES)
         print_success("Successfully connected to DynamoDB Local")
 
         table_names = response.get('TableNames', [])
         if table_names:
-            print_success(f"Found {len(table_names)} table(s):")
+            if 'LastEvaluatedTableName' in response:
+                print_success(f"Found {len(table_names)}+ table(s), showing the first {len(table_names)}:")
+            else:
+                print_success(f"Found {len(table_names)} table(s):")
             for table_name in table_names:
-                print(f"  - {table_name}")
+                print(f"  - {table_name}", file=_out())
         else:
             print_warning("No tables found")
 
@@ -91,24 +138,13 @@ def test_dynamodb_connection(endpoint_url: str = "http://localhost:8000",
         print_error(f"Unexpected error: {e}")
         return False
 
-def test_table_structure(table_name: str = "products_catalog",
-                        endpoint_url: str = "http://localhost:8000",
-                        region: str = "us-east-1") -> bool:
+def test_table_structure(dynamodb, table_name: str = "products_catalog") -> bool:
     """Test specific table structure"""
     print_header(f"TABLE STRUCTURE TEST: {table_name}")
 
     try:
-        dynamodb = boto3.client(
-            'dynamodb',
-            endpoint_url=endpoint_url,
-            region_name=region,
-            aws_access_key_id='local',
-            aws_secret_access_key='local'
-        )
-
         # Describe the table
-        response = dynamodb.describe_table(TableName=table_name)
-        table_info = response['Table']
+        table_info = describe_table(dynamodb, table_name)
 
         print_success(f"Table '{table_name}' found")
         print_info(f"Table Status: {table_info['TableStatus']}")
@@ -118,16 +154,16 @@ def test_table_structure(table_name: str = "products_catalog",
         key_schema = table_info['KeySchema']
         print_info("Key Schema:")
         for key in key_schema:
-            print(f"  - {key['AttributeName']} ({key['KeyType']})")
+            print(f"  - {key['AttributeName']} ({key['KeyType']})", file=_out())
 
         # Check GSIs
         gsis = table_info.get('GlobalSecondaryIndexes', [])
         if gsis:
             print_info(f"Global Secondary Indexes ({len(gsis)}):")
             for gsi in gsis:
-                print(f"  - {gsi['IndexName']}")
+                print(f"  - {gsi['IndexName']}", file=_out())
                 for key in gsi['KeySchema']:
-                    print(f"    {key['AttributeName']} ({key['KeyType']})")
+                    print(f"    {key['AttributeName']} ({key['KeyType']})", file=_out())
         else:
             print_warning("No Global Secondary Indexes found")
 
@@ -147,85 +183,76 @@ def test_table_structure(table_name: str = "products_catalog",
         print_error(f"Unexpected error: {e}")
         return False
 
-def test_basic_operations(table_name: str = "products_catalog",
-                         endpoint_url: str = "http://localhost:8000",
-                         region: str = "us-east-1") -> bool:
+def test_basic_operations(dynamodb, table_name: str = "products_catalog") -> bool:
     """Test basic CRUD operations"""
     print_header("BASIC OPERATIONS TEST")
 
     try:
-        dynamodb = boto3.resource(
-            'dynamodb',
-            endpoint_url=endpoint_url,
-            region_name=region,
-            aws_access_key_id='local',
-            aws_secret_access_key='local'
-        )
-
-        table = dynamodb.Table(table_name)
-
         # Test item to insert/update/delete
         test_item = {
-            'PK': 'TEST#connectivity-test',
-            'SK': 'TEST#connectivity-test',
-            'entity_type': 'test',
-            'test_data': 'DynamoDB connectivity test',
-            'timestamp': '2024-01-01T00:00:00Z'
+            'PK': {'S': 'TEST#connectivity-test'},
+            'SK': {'S': 'TEST#connectivity-test'},
+            'entity_type': {'S': 'test'},
+            'test_data': {'S': 'DynamoDB connectivity test'},
+            'timestamp': {'S': '2024-01-01T00:00:00Z'}
         }
+        test_key = {
+            'PK': test_item['PK'],
+            'SK': test_item['SK']
+        }
+        updated_data = {'S': 'Updated test data'}
 
         print_info("Testing PUT operation...")
-        table.put_item(Item=test_item)
+        dynamodb.put_item(TableName=table_name, Item=test_item)
         print_success("PUT operation successful")
 
-        print_info("Testing GET operation...")
-        response = table.get_item(
-            Key={
-                'PK': test_item['PK'],
-                'SK': test_item['SK']
-            }
-        )
-
-        if 'Item' in response:
-            print_success("GET operation successful")
-            retrieved_item = response['Item']
-            if retrieved_item['test_data'] == test_item['test_data']:
-                print_success("Data integrity verified")
-            else:
-                print_warning("Data integrity issue detected")
-        else:
-            print_error("GET operation failed - item not found")
-            return False
-
+        # UPDATE and DELETE return the item, so the write path is verified
+        # without separate GET round trips
         print_info("Testing UPDATE operation...")
-        table.update_item(
-            Key={
-                'PK': test_item['PK'],
-                'SK': test_item['SK']
-            },
+        response = dynamodb.update_item(
+            TableName=table_name,
+            Key=test_key,
             UpdateExpression='SET test_data = :val',
             ExpressionAttributeValues={
-                ':val': 'Updated test data'
-            }
+                ':val': updated_data
+            },
+            ReturnValues='ALL_NEW'
         )
+
+        updated_item = response.get('Attributes', {})
+        if updated_item.get('entity_type') != test_item['entity_type']:
+            print_error("UPDATE operation failed - item written by PUT not found")
+            return False
         print_success("UPDATE operation successful")
 
+        if updated_item.get('test_data') == updated_data:
+            print_success("Data integrity verified")
+        else:
+            print_warning("Data integrity issue detected")
+
         print_info("Testing DELETE operation...")
-        table.delete_item(
-            Key={
-                'PK': test_item['PK'],
-                'SK': test_item['SK']
-            }
+        response = dynamodb.delete_item(
+            TableName=table_name,
+            Key=test_key,
+            ReturnValues='ALL_OLD'
         )
-        print_success("DELETE operation successful")
-
-        # Verify deletion
-        response = table.get_item(
-            Key={
-                'PK': test_item['PK'],
-                'SK': test_item['SK']
-            }
+
+        if response.get('Attributes', {}).get('test_data') == updated_data:
+            print_success("DELETE operation successful")
+        else:
+            print_warning("DELETE operation returned unexpected item data")
+
+        print_info("Testing GET operation...")
+        # Verify deletion; a strongly consistent read can't return the
+        # just-deleted item, so this check never flakes
+        response = dynamodb.get_item(
+            TableName=table_name,
+            Key=test_key,
+            ConsistentRead=True
         )
 
+        print_success("GET operation successful")
+
         if 'Item' not in response:
             print_success("DELETE verification successful")
         else:
@@ -237,46 +264,49 @@ def test_basic_operations(table_name: str = "products_catalog",
         print_error(f"Basic operations test failed: {e}")
         return False
 
-def test_gsi_queries(table_name: str = "products_catalog",
-                    endpoint_url: str = "http://localhost:8000",
-                    region: str = "us-east-1") -> bool:
+def test_gsi_queries(dynamodb, table_name: str = "products_catalog") -> bool:
     """Test Global Secondary Index queries"""
     print_header("GSI QUERY TEST")
 
     try:
-        dynamodb = boto3.resource(
-            'dynamodb',
-            endpoint_url=endpoint_url,
-            region_name=region,
-            aws_access_key_id='local',
-            aws_secret_access_key='local'
-        )
-
-        table = dynamodb.Table(table_name)
+        # Skip the query round trip for any index the table doesn't have
+        table_info = describe_table(dynamodb, table_name)
+        index_names = {gsi['IndexName'] for gsi in table_info.get('GlobalSecondaryIndexes', [])}
+        all_found = True
 
         print_info("Testing GSI-1 query (inverted index)...")
-        response = table.query(
-            IndexName='GSI-1',
-            KeyConditionExpression='SK = :sk',
-            ExpressionAttributeValues={
-                ':sk': 'BRAND#test'
-            },
-            Limit=1
-        )
-        print_success("GSI-1 query successful")
+        if 'GSI-1' in index_names:
+            dynamodb.query(
+                TableName=table_name,
+                IndexName='GSI-1',
+                KeyConditionExpression='SK = :sk',
+                ExpressionAttributeValues={
+                    ':sk': {'S': 'BRAND#test'}
+                },
+                Limit=1
+            )
+            print_success("GSI-1 query successful")
+        else:
+            print_warning("GSI-1 not found on table, skipping query")
+            all_found = False
 
         print_info("Testing GSI-3 query (brand list)...")
-        response = table.query(
-            IndexName='GSI-3',
-            KeyConditionExpression='GSI3PK = :pk',
-            ExpressionAttributeValues={
-                ':pk': 'BRAND_LIST'
-            },
-            Limit=1
-        )
-        print_success("GSI-3 query successful")
+        if 'GSI-3' in index_names:
+            dynamodb.query(
+                TableName=table_name,
+                IndexName='GSI-3',
+                KeyConditionExpression='GSI3PK = :pk',
+                ExpressionAttributeValues={
+                    ':pk': {'S': 'BRAND_LIST'}
+                },
+                Limit=1
+            )
+            print_success("GSI-3 query successful")
+        else:
+            print_warning("GSI-3 not found on table, skipping query")
+            all_found = False
 
-        return True
+        return all_found
 
     except Exception as e:
         print_error(f"GSI query test failed: {e}")
@@ -286,32 +316,58 @@ def run_comprehensive_test(endpoint_url: str = "http://localhost:8000",
                           region: str = "us-east-1",
                           table_name: str = "products_catalog") -> bool:
     """Run comprehensive DynamoDB test suite"""
-    print(f"{Colors.BOLD}{Colors.BLUE}")
-    print("╔══════════════════════════════════════════════════════╗")
-    print("║           DYNAMODB LOCAL TEST SUITE                 ║")
-    print("╚══════════════════════════════════════════════════════╝")
-    print(f"{Colors.END}")
+    sys.stdout.write("\n".join([
+        f"{Colors.BOLD}{Colors.BLUE}",
+        "╔══════════════════════════════════════════════════════╗",
+        "║           DYNAMODB LOCAL TEST SUITE                 ║",
+        "╚══════════════════════════════════════════════════════╝",
+        f"{Colors.END}",
+    ]) + "\n")
 
     print_info(f"Endpoint: {endpoint_url}")
     print_info(f"Region: {region}")
     print_info(f"Table: {table_name}")
 
+    # One client for the remaining tests instead of one per test
+    probe = create_client(endpoint_url, region, _PROBE_CONFIG)
+    dynamodb = create_client(endpoint_url, region)
+
     tests = [
-        ("Connection Test", lambda: test_dynamodb_connection(endpoint_url, region)),
-        ("Table Structure Test", lambda: test_table_structure(table_name, endpoint_url, region)),
-        ("Basic Operations Test", lambda: test_basic_operations(table_name, endpoint_url, region)),
-        ("GSI Query Test", lambda: test_gsi_queries(table_name, endpoint_url, region))
+        ("Table Structure Test", lambda: test_table_structure(dynamodb, table_name)),
+        ("Basic Operations Test", lambda: test_basic_operations(dynamodb, table_name)),
+        ("GSI Query Test", lambda: test_gsi_queries(dynamodb, table_name))
     ]
 
-    results = []
-
-    for test_name, test_func in tests:
+    def run_buffered(test_name, test_func):
+        _output.buffer = io.StringIO()
         try:
             result = test_func()
-            results.append((test_name, result))
         except Exception as e:
             print_error(f"{test_name} failed with exception: {e}")
-            results.append((test_name, False))
+            result = False
+        output = _output.buffer.getvalue()
+        del _output.buffer
+        return result, output
+
+    # Check the endpoint is reachable before the retrying tests start
+    connected, output = run_buffered(
+        "Connection Test", lambda: test_dynamodb_connection(probe, endpoint_url))
+    sys.stdout.write(output)
+    results = [("Connection Test", connected)]
+
+    if not connected:
+        print_warning("Skipping remaining tests: DynamoDB is not reachable")
+        results.extend((test_name, False) for test_name, _ in tests)
+    else:
+        # The tests are independent and IO-bound, so run them concurrently
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            futures = [executor.submit(run_buffered, test_name, test_func)
+                       for test_name, test_func in tests]
+
+        for (test_name, _), future in zip(tests, futures):
+            result, output = future.result()
+            sys.stdout.write(output)
+            results.append((test_name, result))
 
     # Print summary
     print_header("TEST SUMMARY")
@@ -319,12 +375,14 @@ def run_comprehensive_test(endpoint_url: str = "http://localhost:8000",
     passed = sum(1 for _, result in results if result)
     total = len(results)
 
-    print(f"\n{Colors.BOLD}Results: {passed}/{total} tests passed{Colors.END}\n")
+    lines = [f"\n{Colors.BOLD}Results: {passed}/{total} tests passed{Colors.END}\n"]
 
     for test_name, result in results:
         status = "✓" if result else "✗"
         color = Colors.GREEN if result else Colors.RED
-        print(f"{color}{status} {test_name}{Colors.END}")
+        lines.append(f"{color}{status} {test_name}{Colors.END}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
     if passed == total:
         print_success("\n🎉 All tests passed! DynamoDB Local is working correctly.")
@@ -332,18 +390,25 @@ def run_comprehensive_test(endpoint_url: str = "http://localhost:8000",
     else:
         print_warning(f"\n⚠️  {total - passed} test(s) failed. Please check your setup.")
 
+        steps = []
         if not results[0][1]:  # Connection test failed
-            print_info("\nTroubleshooting steps:")
-            print_info("1. Start DynamoDB Local:")
-            print_info("   docker-compose -f docker-compose.dev.yml up -d")
-            print_info("2. Wait a few seconds for startup")
-            print_info("3. Re-run this test")
+            steps = [
+                "\nTroubleshooting steps:",
+                "1. Start DynamoDB Local:",
+                "   docker-compose -f docker-compose.dev.yml up -d",
+                "2. Wait a few seconds for startup",
+                "3. Re-run this test",
+            ]
 
         elif not results[1][1]:  # Table structure test failed
-            print_info("\nTable setup required:")
-            print_info("1. Run the setup script:")
-            print_info("   ./scripts/local-dev-setup.sh")
-            print_info("2. Re-run this test")
+            steps = [
+                "\nTable setup required:",
+                "1. Run the setup script:",
+                "   ./scripts/local-dev-setup.sh",
+                "2. Re-run this test",
+            ]
+
+        sys.stdout.write("".join(f"{_INFO_PREFIX}{step}{_LINE_END}" for step in steps))
 
         return False
 
@@ -374,7 +439,8 @@ def main():
             sys.exit(0)
         elif sys.argv[1] == '--quick':
             # Quick test - connection only
-            success = test_dynamodb_connection(endpoint_url, region)
+            success = test_dynamodb_connection(
+                create_client(endpoint_url, region, _PROBE_CONFIG), endpoint_url)
             sys.exit(0 if success else 1)
 
     # Run comprehensive test
@@ -2,15 +2,27 @@
 """
 Environment Verification Script for Product Catalog API
 This script verifies that the development environment is properly set up
+
+Usage: python scripts/verify-setup.py [--verbose]
+  --verbose  Report each tool's version instead of only its location
 """
 
 import sys
 import os
+import io
+import hashlib
 import subprocess
 import json
+import shlex
+import shutil
+import platform
+import threading
 import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib import metadata
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
 
 # Colors for output
 class Colors:
@@ -25,27 +37,43 @@ class Colors:
     UNDERLINE = '\033[4m'
     END = '\033[0m'
 
+# Checks run concurrently; each one writes to its own buffer so output
+# can be replayed in order once they finish
+_output = threading.local()
+
+def _out():
+    """Return the current check's output buffer, or stdout outside a check"""
+    return getattr(_output, 'buffer', sys.stdout)
+
+# Color prefixes are built once; each helper then issues a single write
+_SUCCESS_PREFIX = f"{Colors.GREEN}✓ "
+_ERROR_PREFIX = f"{Colors.RED}✗ "
+_WARNING_PREFIX = f"{Colors.YELLOW}⚠ "
+_INFO_PREFIX = f"{Colors.BLUE}ℹ "
+_LINE_END = f"{Colors.END}\n"
+_HEADER_RULE = f"{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.END}"
+
 def print_header(text: str) -> None:
     """Print a formatted header"""
-    print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{text.center(60)}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.END}")
+    _out().write(f"\n{_HEADER_RULE}\n"
+                 f"{Colors.BOLD}{Colors.BLUE}{text.center(60)}{Colors.END}\n"
+                 f"{_HEADER_RULE}\n")
 
 def print_success(text: str) -> None:
     """Print success message"""
-    print(f"{Colors.GREEN}✓ {text}{Colors.END}")
+    _out().write(_SUCCESS_PREFIX + text + _LINE_END)
 
 def print_error(text: str) -> None:
     """Print error message"""
-    print(f"{Colors.RED}✗ {text}{Colors.END}")
+    _out().write(_ERROR_PREFIX + text + _LINE_END)
 
 def print_warning(text: str) -> None:
     """Print warning message"""
-    print(f"{Colors.YELLOW}⚠ {text}{Colors.END}")
+    _out().write(_WARNING_PREFIX + text + _LINE_END)
 
 def print_info(text: str) -> None:
     """Print info message"""
-    print(f"{Colors.BLUE}ℹ {text}{Colors.END}")
+    _out().write(_INFO_PREFIX + text + _LINE_END)
 
 def run_command(cmd: List[str], capture_output: bool = True, timeout: int = 30) -> Tuple[bool, str]:
     """Run a command and return success status and output"""
@@ -65,6 +93,63 @@ def run_command(cmd: List[str], capture_output: bool = True, timeout: int = 30)
     except Exception as e:
         return False, str(e)
 
+@lru_cache(maxsize=None)
+def _find_spec(name: str):
+    """Locate a module without importing it"""
+    return importlib.util.find_spec(name)
+
+@lru_cache(maxsize=None)
+def _import_module(name: str):
+    """Import a module once; later checks reuse the loaded module"""
+    return importlib.import_module(name)
+
+def get_installed_version(name: str) -> str:
+    """Read a package version from its metadata, importing it only as a last resort"""
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return getattr(_import_module(name), '__version__', 'unknown')
+
+# Results of expensive checks, keyed by the content they were run against
+VERIFY_CACHE_FILE = '.verify-cache.json'
+
+def load_verify_cache() -> Dict[str, Any]:
+    """Load cached check results, or an empty cache if missing or unreadable"""
+    try:
+        with open(VERIFY_CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_verify_cache(cache: Dict[str, Any]) -> None:
+    """Persist cached check results; failures only cost a re-run next time"""
+    try:
+        with open(VERIFY_CACHE_FILE, 'w') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+# Markers used to split and classify the output of a batched shell run
+_BATCH_SEPARATOR = '===SPLIT==='
+_BATCH_FAILED = '===FAILED==='
+
+def run_batched_commands(commands: List[List[str]], timeout: int = 30) -> Optional[List[Tuple[bool, str]]]:
+    """
+    Run several commands in one shell process instead of one process each.
+    Returns a (success, output) pair per command, or None if the shell itself
+    couldn't be used (e.g. no POSIX shell on Windows).
+    """
+    script = f' ; echo {_BATCH_SEPARATOR} ; '.join(
+        f'{shlex.join(cmd)} 2>&1 || echo {_BATCH_FAILED}' for cmd in commands
+    )
+    success, output = run_command(['sh', '-c', script], timeout=timeout)
+    chunks = output.split(_BATCH_SEPARATOR)
+
+    if not success or len(chunks) != len(commands):
+        return None
+
+    return [(_BATCH_FAILED not in chunk, chunk.replace(_BATCH_FAILED, '')) for chunk in chunks]
+
 def check_python_version() -> bool:
     """Check if Python version is compatible"""
     print_header("PYTHON VERSION CHECK")
@@ -82,6 +167,9 @@ def check_python_version() -> bool:
         print_error("Required: Python 3.11+ (Recommended: Python 3.13+)")
         return False
 
+# Set by --verbose; also runs each tool's --version instead of a PATH lookup only
+VERBOSE = False
+
 def check_required_tools() -> Dict[str, bool]:
     """Check for required development tools"""
     print_header("REQUIRED TOOLS CHECK")
@@ -96,18 +184,59 @@ def check_required_tools() -> Dict[str, bool]:
 
     results = {}
 
-    for tool, cmd in tools.items():
-        success, output = run_command(cmd)
-        if success:
-            version_line = output.strip().split('\n')[0]
+    # Presence is a PATH lookup; no process is started unless versions were asked for
+    locations = {tool: shutil.which(cmd[0]) for tool, cmd in tools.items()}
+    found = [tool for tool, location in locations.items() if location]
+
+    versions = {}
+    if VERBOSE and found:
+        # One shell runs every probe; fall back to separate processes, side by side
+        commands = [tools[tool] for tool in found]
+        outcomes = run_batched_commands(commands)
+        if outcomes is None:
+            with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+                outcomes = list(executor.map(run_command, commands))
+        versions = dict(zip(found, outcomes))
+
+    for tool, location in locations.items():
+        if not location:
+            print_error(f"{tool}: Not found")
+            results[tool] = False
+        elif tool not in versions:
+            print_success(f"{tool}: {location}")
+            results[tool] = True
+        elif versions[tool][0]:
+            version_line = versions[tool][1].strip().split('\n')[0]
             print_success(f"{tool}: {version_line}")
             results[tool] = True
         else:
-            print_error(f"{tool}: Not found or not working")
+            print_error(f"{tool}: Found at {location} but not working")
             results[tool] = False
 
     return results
 
+def scan_parent_directories(paths: List[str]) -> Tuple[set, set]:
+    """
+    List each distinct parent directory of `paths` once with os.scandir and
+    return the (files, directories) found, as normalized relative paths.
+    Directory entries carry their type, so no per-path stat is needed.
+    """
+    files, dirs = set(), set()
+
+    for parent in {os.path.dirname(path) or '.' for path in paths}:
+        try:
+            with os.scandir(parent) as entries:
+                for entry in entries:
+                    rel_path = os.path.normpath(os.path.join(parent, entry.name))
+                    if entry.is_dir():
+                        dirs.add(rel_path)
+                    elif entry.is_file():
+                        files.add(rel_path)
+        except OSError:
+            continue
+
+    return files, dirs
+
 def check_project_structure() -> bool:
     """Check if project structure is correct"""
     print_header("PROJECT STRUCTURE CHECK")
@@ -139,11 +268,12 @@ def check_project_structure() -> bool:
     ]
 
     all_good = True
+    existing_files, existing_dirs = scan_parent_directories(required_files + required_dirs)
 
     # Check directories
     print_info("Checking directories...")
     for dir_path in required_dirs:
-        if os.path.isdir(dir_path):
+        if os.path.normpath(dir_path) in existing_dirs:
             print_success(f"Directory: {dir_path}")
         else:
             print_error(f"Missing directory: {dir_path}")
@@ -152,7 +282,7 @@ def check_project_structure() -> bool:
     # Check files
     print_info("Checking files...")
     for file_path in required_files:
-        if os.path.isfile(file_path):
+        if os.path.normpath(file_path) in existing_files:
             print_success(f"File: {file_path}")
         else:
             print_error(f"Missing file: {file_path}")
@@ -186,11 +316,9 @@ def check_python_dependencies() -> bool:
 
     for dep, description in core_deps:
         try:
-            spec = importlib.util.find_spec(dep)
+            spec = _find_spec(dep)
             if spec is not None:
-                # Try to import to check if it's actually usable
-                module = importlib.import_module(dep)
-                version = getattr(module, '__version__', 'unknown')
+                version = get_installed_version(dep)
                 print_success(f"{dep} ({description}): v{version}")
             else:
                 print_error(f"{dep} ({description}): Not found")
@@ -207,22 +335,27 @@ def check_aws_config() -> bool:
     """Check AWS configuration"""
     print_header("AWS CONFIGURATION CHECK")
 
-    # Check AWS CLI configuration
-    success, output = run_command(['aws', 'configure', 'list'])
-    if success:
-        print_success("AWS CLI is configured")
-        print_info("Configuration details:")
-        for line in output.strip().split('\n'):
-            if line.strip():
-                print(f"  {line}")
-    else:
-        print_error("AWS CLI is not configured")
-        print_info("Run 'aws configure' to set up your credentials")
-        return False
+    # The connectivity probe is slow, so start it alongside the config check
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        identity_future = executor.submit(
+            run_command, ['aws', 'sts', 'get-caller-identity'], timeout=10)
+
+        # Check AWS CLI configuration
+        success, output = run_command(['aws', 'configure', 'list'])
+        if success:
+            print_success("AWS CLI is configured")
+            print_info("Configuration details:")
+            for line in output.strip().split('\n'):
+                if line.strip():
+                    print(f"  {line}", file=_out())
+        else:
+            print_error("AWS CLI is not configured")
+            print_info("Run 'aws configure' to set up your credentials")
+            return False
 
-    # Check if we can access AWS (optional)
-    print_info("Testing AWS connectivity...")
-    success, output = run_command(['aws', 'sts', 'get-caller-identity'], timeout=10)
+        # Check if we can access AWS (optional)
+        print_info("Testing AWS connectivity...")
+        success, output = identity_future.result()
     if success:
         try:
             identity = json.loads(output)
@@ -235,12 +368,40 @@ def check_aws_config() -> bool:
 
     return True
 
+def docker_socket_candidates() -> List[str]:
+    """Unix socket paths the Docker CLI may use when DOCKER_HOST is not set"""
+    home = os.path.expanduser('~')
+    candidates = [
+        '/var/run/docker.sock',
+        os.path.join(home, '.docker', 'run', 'docker.sock'),      # Docker Desktop (macOS)
+        os.path.join(home, '.docker', 'desktop', 'docker.sock'),  # Docker Desktop (Linux)
+    ]
+    runtime_dir = os.getenv('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        candidates.append(os.path.join(runtime_dir, 'docker.sock'))  # Rootless Docker
+    return candidates
+
+def docker_daemon_unreachable() -> bool:
+    """
+    Cheap pre-check before running `docker info`: True only when we can tell
+    from the filesystem that no local daemon socket exists. Remote daemons
+    (DOCKER_HOST) and Windows named pipes are left to `docker info`.
+    """
+    if platform.system() == 'Windows' or os.getenv('DOCKER_HOST'):
+        return False
+    return not any(os.path.exists(path) for path in docker_socket_candidates())
+
 def check_docker_services() -> bool:
     """Check if Docker services are running"""
     print_header("DOCKER SERVICES CHECK")
 
     # Check if Docker is running
-    success, output = run_command(['docker', 'info'])
+    if docker_daemon_unreachable():
+        print_error("Docker is not running (daemon socket not found)")
+        print_info("Start Docker Desktop or your Docker service")
+        return False
+
+    success, output = run_command(['docker', 'info'], timeout=3)
     if not success:
         print_error("Docker is not running")
         print_info("Start Docker Desktop or your Docker service")
@@ -287,6 +448,15 @@ def check_sam_functionality() -> bool:
         print_error("template.yaml not found")
         return False
 
+    # sam validate is slow; skip it when the template hasn't changed since it last passed
+    with open('template.yaml', 'rb') as f:
+        template_hash = hashlib.blake2b(f.read()).hexdigest()
+
+    cache = load_verify_cache()
+    if cache.get('template_yaml') == template_hash and cache.get('sam_ok'):
+        print_success("SAM template is valid (unchanged since last validation)")
+        return True
+
     success, output = run_command(['sam', 'validate'])
     if success:
         print_success("SAM template is valid")
@@ -295,14 +465,8 @@ def check_sam_functionality() -> bool:
         print_error(output)
         return False
 
-    # Check if we can build (dry run)
-    print_info("Testing SAM build...")
-    success, output = run_command(['sam', 'build', '--help'])
-    if success:
-        print_success("SAM build command is available")
-    else:
-        print_error("SAM build command failed")
-        return False
+    cache.update({'template_yaml': template_hash, 'sam_ok': True})
+    save_verify_cache(cache)
 
     return True
 
@@ -317,9 +481,10 @@ def check_environment_variables() -> bool:
     }
 
     all_set = True
+    env = os.environ
 
     for var, description in env_vars.items():
-        value = os.getenv(var)
+        value = env.get(var)
         if value:
             if var == 'DYNAMODB_ENDPOINT' and 'localhost' in value:
                 print_success(f"{var}: {value} (local development)")
@@ -336,15 +501,16 @@ def check_environment_variables() -> bool:
 
     return True  # Environment variables are not critical for verification
 
+def ensure_src_on_path() -> None:
+    """Put the project's src directory first on sys.path (once, from main)"""
+    src_path = os.path.join(os.getcwd(), 'src')
+    if sys.path[0] != src_path:
+        sys.path.insert(0, src_path)
+
 def test_imports() -> bool:
     """Test if our custom modules can be imported"""
     print_header("MODULE IMPORT TEST")
 
-    # Add src to Python path
-    src_path = os.path.join(os.getcwd(), 'src')
-    if src_path not in sys.path:
-        sys.path.insert(0, src_path)
-
     modules = [
         ('config.settings', 'Configuration settings'),
         ('utils.exceptions', 'Custom exceptions'),
@@ -358,7 +524,7 @@ def test_imports() -> bool:
 
     for module_name, description in modules:
         try:
-            importlib.import_module(module_name)
+            _import_module(module_name)
             print_success(f"{module_name}: {description}")
         except ImportError as e:
             print_error(f"{module_name}: Import failed - {e}")
@@ -373,11 +539,6 @@ def run_basic_functionality_test() -> bool:
     print_header("BASIC FUNCTIONALITY TEST")
 
     try:
-        # Add src to Python path
-        src_path = os.path.join(os.getcwd(), 'src')
-        if src_path not in sys.path:
-            sys.path.insert(0, src_path)
-
         # Test basic model functionality
         from models.brand import Brand
         from utils.exceptions import ValidationError
@@ -462,6 +623,9 @@ def generate_summary(results: Dict[str, bool]) -> None:
 
 def main():
     """Main verification function"""
+    global VERBOSE
+    VERBOSE = '--verbose' in sys.argv[1:]
+
     print(f"{Colors.BOLD}{Colors.PURPLE}")
     print("╔════════════════════════════════════════════════════════════╗")
     print("║                 PRODUCT CATALOG API                        ║")
@@ -473,22 +637,52 @@ def main():
     script_dir = Path(__file__).parent.parent
     os.chdir(script_dir)
 
+    ensure_src_on_path()
+
     print_info(f"Working directory: {os.getcwd()}")
     print_info(f"Python executable: {sys.executable}")
 
-    # Run all checks
+    # Checks in report order. The subprocess-bound ones run on worker threads;
+    # the rest stay on the main thread since they import modules and touch sys.path
+    checks = [
+        ('python_version', check_python_version, False),
+        ('required_tools', check_required_tools, True),
+        ('project_structure', check_project_structure, False),
+        ('python_dependencies', check_python_dependencies, False),
+        ('aws_config', check_aws_config, True),
+        ('docker_services', check_docker_services, True),
+        ('sam_functionality', check_sam_functionality, True),
+        ('environment_variables', check_environment_variables, False),
+        ('module_imports', test_imports, False),
+        ('basic_functionality', run_basic_functionality_test, False)
+    ]
+
+    def run_buffered(check):
+        _output.buffer = io.StringIO()
+        try:
+            result = check()
+        finally:
+            output = _output.buffer.getvalue()
+            del _output.buffer
+        return result, output
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {name: executor.submit(run_buffered, check)
+                   for name, check, concurrent in checks if concurrent}
+        outcomes = {name: run_buffered(check)
+                    for name, check, concurrent in checks if not concurrent}
+        outcomes.update((name, future.result()) for name, future in futures.items())
+
+    # Replay output in report order and collect results
     results = {}
 
-    results['python_version'] = check_python_version()
-    results.update(check_required_tools())
-    results['project_structure'] = check_project_structure()
-    results['python_dependencies'] = check_python_dependencies()
-    results['aws_config'] = check_aws_config()
-    results['docker_services'] = check_docker_services()
-    results['sam_functionality'] = check_sam_functionality()
-    results['environment_variables'] = check_environment_variables()
-    results['module_imports'] = test_imports()
-    results['basic_functionality'] = run_basic_functionality_test()
+    for name, _, _ in checks:
+        result, output = outcomes[name]
+        sys.stdout.write(output)
+        if isinstance(result, dict):
+            results.update(result)
+        else:
+            results[name] = result
 
     # Generate summary
     generate_summary(results)
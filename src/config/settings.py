@@ -1,8 +1,22 @@
 import os
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
 
 # Using the single table design.
 TABLE_NAME = os.getenv('DYNAMODB_TABLE', 'products_catalog')
 
+# DynamoDB Local endpoint (unset in AWS)
+DYNAMODB_ENDPOINT = os.getenv('DYNAMODB_ENDPOINT')
+
+# DynamoDB client timeouts (seconds) and total attempts per call, retries
+# included. Sized for normal tail latency of TransactWriteItems and 100-key
+# BatchGetItem calls; the worst case, 3 x (2 + 5)s, stays under the 29s
+# API Gateway/Lambda timeout
+DYNAMODB_CONNECT_TIMEOUT = float(os.getenv('DYNAMODB_CONNECT_TIMEOUT', '2'))
+DYNAMODB_READ_TIMEOUT = float(os.getenv('DYNAMODB_READ_TIMEOUT', '5'))
+DYNAMODB_MAX_ATTEMPTS = int(os.getenv('DYNAMODB_MAX_ATTEMPTS', '3'))
+
 # Primary Key Field Names
 PK_FIELD = 'PK'
 SK_FIELD = 'SK'
@@ -24,31 +38,65 @@ GSI3_SK = 'GSI3SK'
 BRAND_PREFIX = 'BRAND'
 CATEGORY_PREFIX = 'CATEGORY'
 PRODUCT_PREFIX = 'PRODUCT'
+PRODUCT_LIST_PREFIX = 'PRODUCT_LIST'
+
+# Key prefixes including the separator, so key helpers are a single concatenation
+_BRAND_KEY_PREFIX = f"{BRAND_PREFIX}#"
+_CATEGORY_KEY_PREFIX = f"{CATEGORY_PREFIX}#"
+_PRODUCT_KEY_PREFIX = f"{PRODUCT_PREFIX}#"
+_PRODUCT_LIST_KEY_PREFIX = f"{PRODUCT_LIST_PREFIX}#"
 
 # Key Generation Functions
 def get_brand_pk(brand_id):
     """Generate brand partition key"""
-    return f"{BRAND_PREFIX}#{brand_id}"
+    return _BRAND_KEY_PREFIX + brand_id
 
 def get_brand_sk(brand_id):
     """Generate brand sort key"""
-    return f"{BRAND_PREFIX}#{brand_id}"
+    return _BRAND_KEY_PREFIX + brand_id
+
+# The get_*_keys (PK, SK) pair helpers are memoized: IDs repeat within a warm
+# container and the cached call skips the Python frame; the tuples are immutable.
+# The single-key get_*_pk/get_*_sk helpers stay plain concatenations
+@lru_cache(maxsize=4096)
+def get_brand_keys(brand_id):
+    """Generate the brand (partition key, sort key) pair; both share one string"""
+    key = _BRAND_KEY_PREFIX + brand_id
+    return key, key
 
 def get_category_pk(category_id):
     """Generate category partition key"""
-    return f"{CATEGORY_PREFIX}#{category_id}"
+    return _CATEGORY_KEY_PREFIX + category_id
 
 def get_category_sk(category_id):
     """Generate category sort key"""
-    return f"{CATEGORY_PREFIX}#{category_id}"
+    return _CATEGORY_KEY_PREFIX + category_id
+
+@lru_cache(maxsize=4096)
+def get_category_keys(category_id):
+    """Generate the category (partition key, sort key) pair; both share one string"""
+    key = _CATEGORY_KEY_PREFIX + category_id
+    return key, key
 
 def get_product_pk(product_id):
     """Generate product partition key"""
-    return f"{PRODUCT_PREFIX}#{product_id}"
+    return _PRODUCT_KEY_PREFIX + product_id
 
 def get_product_sk(product_id):
     """Generate product sort key"""
-    return f"{PRODUCT_PREFIX}#{product_id}"
+    return _PRODUCT_KEY_PREFIX + product_id
+
+@lru_cache(maxsize=4096)
+def get_product_keys(product_id):
+    """Generate the product (partition key, sort key) pair; both share one string"""
+    key = _PRODUCT_KEY_PREFIX + product_id
+    return key, key
+
+@lru_cache(maxsize=4096)
+def get_product_list_keys(product_id):
+    """Generate the (partition key, sort key) pair of a product's PRODUCT_LIST item"""
+    key = _PRODUCT_LIST_KEY_PREFIX + product_id
+    return key, key
 
 # Access Pattern Helper Functions
 def get_entity_list_keys(entity_type):
@@ -91,59 +139,74 @@ def get_gsi3_keys(gsi3_pk, gsi3_sk=None):
     }
 
 # Item Structure Helpers
+def generate_id():
+    """
+    New entity ID: a random (version 4) UUID as 32 hex chars. Built straight
+    from os.urandom, which is what uuid.uuid4() does behind UUID's overhead.
+    """
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    return raw.hex()
+
+def utc_now_iso():
+    """Current UTC time as the ISO-8601 string stored in created_at/updated_at"""
+    return datetime.now(timezone.utc).isoformat()
+
+def _with_optional_fields(item, **optional_fields):
+    """Merge in the optional fields that have a value; empty ones are left off the item"""
+    item |= {key: value for key, value in optional_fields.items() if value}
+    return item
+
 def create_brand_item(brand_id, name, description=None, website=None):
     """Create a brand item structure"""
-    from datetime import datetime
+    now = utc_now_iso()
+    pk, sk = get_brand_keys(brand_id)
 
     item = {
-        PK_FIELD: get_brand_pk(brand_id),
-        SK_FIELD: get_brand_sk(brand_id),
+        PK_FIELD: pk,
+        SK_FIELD: sk,
         GSI3_PK: 'BRAND_LIST',  # For listing all brands
         GSI3_SK: name.upper(),  # For sorting brands by name
         'entity_type': 'brand',
         'brand_id': brand_id,
         'name': name,
         'description': description,
-        'created_at': datetime.utcnow().isoformat(),
-        'updated_at': datetime.utcnow().isoformat()
+        'created_at': now,
+        'updated_at': now
     }
 
-    if website:
-        item['website'] = website
-
-    return item
+    return _with_optional_fields(item, website=website)
 
 def create_category_item(category_id, name, description=None, parent_category_id=None):
     """Create a category item structure"""
-    from datetime import datetime
+    now = utc_now_iso()
+    pk, sk = get_category_keys(category_id)
 
     item = {
-        PK_FIELD: get_category_pk(category_id),
-        SK_FIELD: get_category_sk(category_id),
+        PK_FIELD: pk,
+        SK_FIELD: sk,
         GSI3_PK: 'CATEGORY_LIST',  # For listing all categories
         GSI3_SK: name.upper(),     # For sorting categories by name
         'entity_type': 'category',
         'category_id': category_id,
         'name': name,
-        'created_at': datetime.utcnow().isoformat(),
-        'updated_at': datetime.utcnow().isoformat()
+        'created_at': now,
+        'updated_at': now
     }
 
-    if description:
-        item['description'] = description
-    if parent_category_id:
-        item['parent_category_id'] = parent_category_id
-
-    return item
+    return _with_optional_fields(item, description=description,
+                                 parent_category_id=parent_category_id)
 
 def create_product_item(product_id, name, brand_id, category_id, price,
                        description=None, stock_quantity=0, images=None):
     """Create a product item structure"""
-    from datetime import datetime
+    now = utc_now_iso()
+    pk, sk = get_product_keys(product_id)
 
     item = {
-        PK_FIELD: get_product_pk(product_id),
-        SK_FIELD: get_product_sk(product_id),
+        PK_FIELD: pk,
+        SK_FIELD: sk,
         # GSI-2 fields for products by brand
         'brand_id': brand_id,
         'product_id': product_id,
@@ -155,28 +218,24 @@ def create_product_item(product_id, name, brand_id, category_id, price,
         'category_id': category_id,
         'price': price,
         'stock_quantity': stock_quantity,
-        'created_at': datetime.utcnow().isoformat(),
-        'updated_at': datetime.utcnow().isoformat()
+        'created_at': now,
+        'updated_at': now
     }
 
-    if description:
-        item['description'] = description
-
-    if images:
-        item['images'] = images
-
-    return item
+    return _with_optional_fields(item, description=description, images=images)
 
 def create_product_list_item(product_id, name, brand_id, category_id, price,
                             description=None, stock_quantity=0, images=None):
     """Create a product list item for GSI-3 PRODUCT_LIST queries"""
-    from datetime import datetime
+    now = utc_now_iso()
+
+    pk, sk = get_product_list_keys(product_id)
 
     item = {
-        PK_FIELD: f"PRODUCT_LIST#{product_id}",
-        SK_FIELD: f"PRODUCT_LIST#{product_id}",
+        PK_FIELD: pk,
+        SK_FIELD: sk,
         # GSI-3 for listing all products
-        GSI3_PK: 'PRODUCT_LIST',
+        GSI3_PK: PRODUCT_LIST_PREFIX,
         GSI3_SK: name.upper(),  # For sorting products by name
         'entity_type': 'product_list',
         'product_id': product_id,
@@ -185,50 +244,44 @@ def create_product_list_item(product_id, name, brand_id, category_id, price,
         'category_id': category_id,
         'price': price,
         'stock_quantity': stock_quantity,
-        'created_at': datetime.utcnow().isoformat(),
-        'updated_at': datetime.utcnow().isoformat()
+        'created_at': now,
+        'updated_at': now
     }
 
-    if description:
-        item['description'] = description
-
-    if images:
-        item['images'] = images
-
-    return item
+    return _with_optional_fields(item, description=description, images=images)
 
-# Access Pattern Documentation
-ACCESS_PATTERNS = {
-    'get_brand_by_id': {
+# Access Pattern Documentation (read-only)
+ACCESS_PATTERNS = MappingProxyType({
+    'get_brand_by_id': MappingProxyType({
         'operation': 'get_item',
         'keys': 'PK=BRAND#{id}, SK=BRAND#{id}'
-    },
-    'list_all_brands': {
+    }),
+    'list_all_brands': MappingProxyType({
         'operation': 'query',
         'index': 'GSI-1',
         'keys': 'SK begins_with BRAND#'
-    },
-    'list_brands_by_name': {
+    }),
+    'list_brands_by_name': MappingProxyType({
         'operation': 'query',
         'index': 'GSI-3',
         'keys': 'GSI3PK=BRAND_LIST, GSI3SK sorted by name'
-    },
-    'list_categories_by_name': {
+    }),
+    'list_categories_by_name': MappingProxyType({
         'operation': 'query',
         'index': 'GSI-3',
         'keys': 'GSI3PK=CATEGORY_LIST, GSI3SK sorted by name'
-    },
-    'get_products_by_brand': {
+    }),
+    'get_products_by_brand': MappingProxyType({
         'operation': 'query',
         'index': 'GSI-2',
         'keys': 'brand_id={brand_id}'
-    },
-    'get_products_by_category': {
+    }),
+    'get_products_by_category': MappingProxyType({
         'operation': 'query',
         'index': 'GSI-3',
         'keys': 'GSI3PK=CATEGORY#{category_id}'
-    }
-}
+    })
+})
 
 # API Configuration
 API_VERSION = 'v1'
@@ -241,12 +294,17 @@ ENABLE_SOFT_DELETE = os.getenv('ENABLE_SOFT_DELETE', 'false').lower() == 'true'
 # AWS Configuration
 AWS_REGION = os.getenv('AWS_REGION', 'us-east-1')
 
+# Set by the Lambda runtime (and SAM local); unset in tests and scripts
+RUNNING_IN_LAMBDA = bool(os.getenv('AWS_LAMBDA_FUNCTION_NAME'))
+
 # CORS Configuration
-CORS_ORIGINS = os.getenv('CORS_ORIGINS', '*').split(',')
-CORS_HEADERS = [
+CORS_ORIGINS = tuple(os.getenv('CORS_ORIGINS', '*').split(','))
+CORS_HEADERS = frozenset({
     'Content-Type',
     'X-Amz-Date',
     'Authorization',
     'X-Api-Key',
     'X-Amz-Security-Token'
-]
+})
+# Access-Control-Allow-Headers value, joined once in a stable order
+CORS_HEADERS_STR = ', '.join(sorted(CORS_HEADERS))
@@ -1,11 +1,11 @@
-import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from services.brand_service import BrandService
 from utils.response import (
     success_response, created_response, bad_request_response,
     not_found_response, conflict_response, server_error_response,
-    parse_json_body, get_query_parameter
+    parse_json_body, get_query_parameter, get_last_evaluated_key,
+    get_path_parameters
 )
 from utils.exceptions import ValidationError, NotFoundError, DuplicateError
 from utils.logger import setup_logger, log_request_info
@@ -31,77 +31,92 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 
     # Support both API Gateway v1 (REST API) and v2 (HTTP API) event formats
     http_method = event.get('httpMethod') or event.get('requestContext', {}).get('http', {}).get('method')
-    path_parameters = event.get('pathParameters') or {}
+    path_parameters = get_path_parameters(event)
     brand_id = path_parameters.get('id')
 
-    logger.debug(f"Brand ID extracted: {brand_id}")
+    logger.debug("Brand ID extracted: %s", brand_id)
 
     try:
-        if http_method == 'GET':
-            if brand_id:
-                # Get specific brand
-                brand = BrandService.get_brand(brand_id)
-                if not brand:
-                    return not_found_response("Brand not found")
-                return success_response(brand)
-            else:
-                # List all brands
-                limit = int(get_query_parameter(event, 'limit', 50))
-                last_key = get_query_parameter(event, 'last_key')
-
-                # Parse last_key if provided
-                last_evaluated_key = None
-                if last_key:
-                    try:
-                        last_evaluated_key = json.loads(last_key)
-                    except json.JSONDecodeError:
-                        return bad_request_response("Invalid last_key format")
-
-                brands_data = BrandService.list_brands(limit, last_evaluated_key)
-                return success_response(brands_data)
-
-        elif http_method == 'POST':
-            # Create new brand
-            data = parse_json_body(event)
-            brand = BrandService.create_brand(data)
-            return created_response(brand, "Brand created successfully")
-
-        elif http_method == 'PUT':
-            if not brand_id:
-                return bad_request_response("Brand ID is required")
-
-            # Update brand
-            data = parse_json_body(event)
-            brand = BrandService.update_brand(brand_id, data)
-            if not brand:
-                return not_found_response("Brand not found")
-            return success_response(brand, "Brand updated successfully")
-
-        elif http_method == 'DELETE':
-            if not brand_id:
-                return bad_request_response("Brand ID is required")
-
-            # Delete brand
-            deleted = BrandService.delete_brand(brand_id)
-            if not deleted:
-                return not_found_response("Brand not found")
-            return success_response(None, "Brand deleted successfully")
-
-        else:
+        handler = CRUD_ROUTES.get((http_method, bool(brand_id)))
+        if not handler:
             return bad_request_response(f"Method {http_method} not allowed")
+        return handler(event, brand_id)
 
     except ValidationError as e:
-        logger.warning(f"Validation error: {str(e)}")
+        logger.warning("Validation error: %s", e)
         return bad_request_response(str(e))
     except DuplicateError as e:
-        logger.warning(f"Duplicate error: {str(e)}")
+        logger.warning("Duplicate error: %s", e)
         return conflict_response(str(e))
     except NotFoundError as e:
-        logger.info(f"Not found: {str(e)}")
+        logger.info("Not found: %s", e)
         return not_found_response(str(e))
     except ValueError as e:
-        logger.warning(f"Value error: {str(e)}")
+        logger.warning("Value error: %s", e)
         return bad_request_response(str(e))
     except Exception as e:
-        logger.error(f"Unexpected error in brands handler: {str(e)}", exc_info=True)
+        logger.error("Unexpected error in brands handler: %s", e, exc_info=True)
         return server_error_response("An unexpected error occurred")
+
+
+def handle_list(event: Dict[str, Any], brand_id: Optional[str]) -> Dict[str, Any]:
+    """Handle GET /brands"""
+    limit = int(get_query_parameter(event, 'limit', 50))
+    last_evaluated_key = get_last_evaluated_key(event)
+
+    brands_data = BrandService.list_brands(limit, last_evaluated_key)
+    return success_response(brands_data)
+
+
+def handle_get(event: Dict[str, Any], brand_id: Optional[str]) -> Dict[str, Any]:
+    """Handle GET /brands/{brand_id}"""
+    brand = BrandService.get_brand(brand_id)
+    if not brand:
+        return not_found_response("Brand not found")
+    return success_response(brand)
+
+
+def handle_post(event: Dict[str, Any], brand_id: Optional[str]) -> Dict[str, Any]:
+    """Handle POST /brands"""
+    # Create new brand
+    data = parse_json_body(event)
+    brand = BrandService.create_brand(data)
+    return created_response(brand, "Brand created successfully")
+
+
+def handle_put(event: Dict[str, Any], brand_id: Optional[str]) -> Dict[str, Any]:
+    """Handle PUT /brands/{brand_id}"""
+    # Update brand
+    data = parse_json_body(event)
+    brand = BrandService.update_brand(brand_id, data)
+    if not brand:
+        return not_found_response("Brand not found")
+    return success_response(brand, "Brand updated successfully")
+
+
+def handle_delete(event: Dict[str, Any], brand_id: Optional[str]) -> Dict[str, Any]:
+    """Handle DELETE /brands/{brand_id}"""
+    # Delete brand
+    deleted = BrandService.delete_brand(brand_id)
+    if not deleted:
+        return not_found_response("Brand not found")
+    return success_response(None, "Brand deleted successfully")
+
+
+def handle_missing_id(event: Dict[str, Any], brand_id: Optional[str]) -> Dict[str, Any]:
+    """Handle PUT/DELETE /brands without a brand ID"""
+    return bad_request_response("Brand ID is required")
+
+
+# Dispatch table for the standard CRUD routes, keyed on (HTTP method, has an ID)
+# so the list/single-item split is resolved once here instead of per request
+CRUD_ROUTES = {
+    ('GET', False): handle_list,
+    ('GET', True): handle_get,
+    ('POST', False): handle_post,
+    ('POST', True): handle_post,
+    ('PUT', False): handle_missing_id,
+    ('PUT', True): handle_put,
+    ('DELETE', False): handle_missing_id,
+    ('DELETE', True): handle_delete
+}
@@ -1,12 +1,12 @@
-import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 from services.category_service import CategoryService
 from utils.response import (
     success_response, created_response, bad_request_response,
     not_found_response, conflict_response, server_error_response,
-    parse_json_body, get_query_parameter
+    parse_json_body, get_query_parameter, get_last_evaluated_key,
+    get_path_parameters
 )
 from utils.exceptions import ValidationError, NotFoundError, DuplicateError
 from utils.logger import setup_logger, log_request_info
@@ -32,77 +32,92 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 
     # Support both API Gateway v1 (REST API) and v2 (HTTP API) event formats
     http_method = event.get('httpMethod') or event.get('requestContext', {}).get('http', {}).get('method')
-    path_parameters = event.get('pathParameters') or {}
+    path_parameters = get_path_parameters(event)
     category_id = path_parameters.get('id')
 
-    logger.debug(f"Category ID extracted: {category_id}")
+    logger.debug("Category ID extracted: %s", category_id)
 
     try:
-        if http_method == 'GET':
-            if category_id:
-                # Get new category
-                category = CategoryService.get_category(category_id)
-                if not category:
-                    return not_found_response("Category not found")
-                return success_response(category)
-            else:
-                # List all categories
-                limit = int(get_query_parameter(event, 'limit', 50))
-                last_key = get_query_parameter(event, 'last_key')
-
-                # Parse last_key if provided
-                last_evaluated_key = None
-                if last_key:
-                    try:
-                        last_evaluated_key = json.loads(last_key)
-                    except json.JSONDecodeError:
-                        return bad_request_response("Invalid last_key format")
-
-                categories_data = CategoryService.list_categories(limit, last_evaluated_key)
-                return success_response(categories_data)
-
-        elif http_method == 'POST':
-            # Create new category
-            data = parse_json_body(event)
-            category = CategoryService.create_category(data)
-            return created_response(category, "Category created successfully")
-
-        elif http_method == 'PUT':
-            if not category_id:
-                return bad_request_response("Category ID is required")
-
-            # Update category
-            data = parse_json_body(event)
-            category = CategoryService.update_category(category_id, data)
-            if not category:
-                return not_found_response("Category not found")
-            return success_response(category, "Category updated successfully")
-
-        elif http_method == 'DELETE':
-            if not category_id:
-                return bad_request_response("Category ID is required")
-
-            # Delete category
-            deleted = CategoryService.delete_category(category_id)
-            if not deleted:
-                return not_found_response("Category not found")
-            return success_response(None, "Category deleted successfully")
-
-        else:
+        handler = CRUD_ROUTES.get((http_method, bool(category_id)))
+        if not handler:
             return bad_request_response(f"Method {http_method} not allowed")
+        return handler(event, category_id)
 
     except ValidationError as e:
-        logger.warning(f"Validation error: {str(e)}")
+        logger.warning("Validation error: %s", e)
         return bad_request_response(str(e))
     except DuplicateError as e:
-        logger.warning(f"Duplicate error: {str(e)}")
+        logger.warning("Duplicate error: %s", e)
         return conflict_response(str(e))
     except NotFoundError as e:
-        logger.info(f"Not found: {str(e)}")
+        logger.info("Not found: %s", e)
         return not_found_response(str(e))
     except ValueError as e:
-        logger.warning(f"Value error: {str(e)}")
+        logger.warning("Value error: %s", e)
         return bad_request_response(str(e))
     except Exception as e:
-        logger.error(f"Unexpected error in categories handler: {str(e)}", exc_info=True)
+        logger.error("Unexpected error in categories handler: %s", e, exc_info=True)
         return server_error_response("An unexpected error occurred")
+
+
+def handle_list(event: Dict[str, Any], category_id: Optional[str]) -> Dict[str, Any]:
+    """Handle GET /categories"""
+    limit = int(get_query_parameter(event, 'limit', 50))
+    last_evaluated_key = get_last_evaluated_key(event)
+
+    categories_data = CategoryService.list_categories(limit, last_evaluated_key)
+    return success_response(categories_data)
+
+
+def handle_get(event: Dict[str, Any], category_id: Optional[str]) -> Dict[str, Any]:
+    """Handle GET /categories/{category_id}"""
+    category = CategoryService.get_category(category_id)
+    if not category:
+        return not_found_response("Category not found")
+    return success_response(category)
+
+
+def handle_post(event: Dict[str, Any], category_id: Optional[str]) -> Dict[str, Any]:
+    """Handle POST /categories"""
+    # Create new category
+    data = parse_json_body(event)
+    category = CategoryService.create_category(data)
+    return created_response(category, "Category created successfully")
+
+
+def handle_put(event: Dict[str, Any], category_id: Optional[str]) -> Dict[str, Any]:
+    """Handle PUT /categories/{category_id}"""
+    # Update category
+    data = parse_json_body(event)
+    category = CategoryService.update_category(category_id, data)
+    if not category:
+        return not_found_response("Category not found")
+    return success_response(category, "Category updated successfully")
+
+
+def handle_delete(event: Dict[str, Any], category_id: Optional[str]) -> Dict[str, Any]:
+    """Handle DELETE /categories/{category_id}"""
+    # Delete category
+    deleted = CategoryService.delete_category(category_id)
+    if not deleted:
+        return not_found_response("Category not found")
+    return success_response(None, "Category deleted successfully")
+
+
+def handle_missing_id(event: Dict[str, Any], category_id: Optional[str]) -> Dict[str, Any]:
+    """Handle PUT/DELETE /categories without a category ID"""
+    return bad_request_response("Category ID is required")
+
+
+# Dispatch table for the standard CRUD routes, keyed on (HTTP method, has an ID)
+# so the list/single-item split is resolved once here instead of per request
+CRUD_ROUTES = {
+    ('GET', False): handle_list,
+    ('GET', True): handle_get,
+    ('POST', False): handle_post,
+    ('POST', True): handle_post,
+    ('PUT', False): handle_missing_id,
+    ('PUT', True): handle_put,
+    ('DELETE', False): handle_missing_id,
+    ('DELETE', True): handle_delete
+}
@@ -1,11 +1,11 @@
-import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from services.product_service import ProductService
 from utils.response import (
     success_response, created_response, bad_request_response,
     not_found_response, conflict_response, server_error_response,
-    parse_json_body, get_query_parameter
+    parse_json_body, get_query_parameter, get_last_evaluated_key,
+    get_path_parameters
 )
 from utils.exceptions import ValidationError, NotFoundError, DuplicateError
 from utils.logger import setup_logger, log_request_info
@@ -20,7 +20,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 
     Routes:
     - GET /products - List all products
-    - POST /products - Create a new product
+    - POST /products - Create a new product (or several, from a JSON array body)
     - GET /products/{product_id} - Get a specific product
     - PUT /products/{product_id} - Update a product
     - DELETE /products/{product_id} - Delete a product
@@ -31,124 +31,116 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 
     # Support both API Gateway v1 (REST API) and v2 (HTTP API) event formats
     http_method = event.get('httpMethod') or event.get('requestContext', {}).get('http', {}).get('method')
-    path_parameters = event.get('pathParameters') or {}
+    path_parameters = get_path_parameters(event)
     product_id = path_parameters.get('id')
-    brand_id = path_parameters.get('brand_id')
-    category_id = path_parameters.get('category_id')
-    # For HTTP API v2, use rawPath or routeKey; for REST API use resource
-    resource_path = event.get('resource') or event.get('rawPath', '')
+    route_template = get_route_template(event)
 
     # Log request information
     log_request_info(logger, event)
 
-    logger.debug(f"Product ID: {product_id}, Brand ID: {brand_id}, Category ID: {category_id}")
+    # Sub-resource IDs are only read by the route that needs them
+    logger.debug("Route: %s, path parameters: %s", route_template, path_parameters)
 
     try:
-        # Handle different resource paths
-        if '/by-brand/' in resource_path:
-            # GET /products/by-brand/{brand_id}
-            if not brand_id:
-                return bad_request_response("Brand ID is required")
-            return handle_products_by_brand(event, brand_id)
-
-        elif '/by-category/' in resource_path:
-            # GET /products/by-category/{category_id}
-            if not category_id:
-                return bad_request_response("Category ID is required")
-            return handle_products_by_category(event, category_id)
-
-
-        elif '/stock' in resource_path:
-            # PATCH /products/{product_id}/stock
-            if not product_id:
-                return bad_request_response("Product ID is required")
-            return handle_stock_update(event, product_id)
-
-        else:
-            # Standard CRUD operations
-            if http_method == 'GET':
-                if product_id:
-                    # Get specific product
-                    product = ProductService.get_product(product_id)
-                    if not product:
-                        return not_found_response("Product not found")
-                    return success_response(product)
-                else:
-                    # List all products
-                    limit = int(get_query_parameter(event, 'limit', 50))
-                    last_key = get_query_parameter(event, 'last_key')
-
-                    # Parse last_key if provided
-                    last_evaluated_key = None
-                    if last_key:
-                        try:
-                            last_evaluated_key = json.loads(last_key)
-                        except json.JSONDecodeError:
-                            return bad_request_response("Invalid last_key format")
-
-                    products_data = ProductService.list_products(limit, last_evaluated_key)
-                    return success_response(products_data)
-
-            elif http_method == 'POST':
-                # Create new product
-                data = parse_json_body(event)
-                product = ProductService.create_product(data)
-                return created_response(product, "Product created successfully")
-
-            elif http_method == 'PUT':
-                if not product_id:
-                    return bad_request_response("Product ID is required")
-
-                # Update product
-                data = parse_json_body(event)
-                product = ProductService.update_product(product_id, data)
-                if not product:
-                    return not_found_response("Product not found")
-                return success_response(product, "Product updated successfully")
-
-            elif http_method == 'DELETE':
-                if not product_id:
-                    return bad_request_response("Product ID is required")
-
-                # Delete product
-                deleted = ProductService.delete_product(product_id)
-                if not deleted:
-                    return not_found_response("Product not found")
-                return success_response(None, "Product deleted successfully")
-
-            else:
-                return bad_request_response(f"Method {http_method} not allowed")
+        # Sub-resource routes are matched on the exact route template
+        sub_resource = SUB_RESOURCE_ROUTES.get(route_template)
+        if sub_resource:
+            param_name, missing_message, route_handler = sub_resource
+            param_value = path_parameters.get(param_name)
+            if not param_value:
+                return bad_request_response(missing_message)
+            return route_handler(event, param_value)
+
+        # Standard CRUD operations
+        handler = CRUD_ROUTES.get((http_method, bool(product_id)))
+        if not handler:
+            return bad_request_response(f"Method {http_method} not allowed")
+        return handler(event, product_id)
 
     except ValidationError as e:
-        logger.warning(f"Validation error: {str(e)}")
+        logger.warning("Validation error: %s", e)
         return bad_request_response(str(e))
     except DuplicateError as e:
-        logger.warning(f"Duplicate error: {str(e)}")
+        logger.warning("Duplicate error: %s", e)
         return conflict_response(str(e))
     except NotFoundError as e:
-        logger.info(f"Not found: {str(e)}")
+        logger.info("Not found: %s", e)
         return not_found_response(str(e))
     except ValueError as e:
-        logger.warning(f"Value error: {str(e)}")
+        logger.warning("Value error: %s", e)
         return bad_request_response(str(e))
     except Exception as e:
-        logger.error(f"Unexpected error in products handler: {str(e)}", exc_info=True)
+        logger.error("Unexpected error in products handler: %s", e, exc_info=True)
         return server_error_response("An unexpected error occurred")
 
 
+def handle_list(event: Dict[str, Any], product_id: Optional[str]) -> Dict[str, Any]:
+    """Handle GET /products"""
+    limit = int(get_query_parameter(event, 'limit', 50))
+    last_evaluated_key = get_last_evaluated_key(event)
+
+    products_data = ProductService.list_products(limit, last_evaluated_key)
+    return success_response(products_data)
+
+
+def handle_get(event: Dict[str, Any], product_id: Optional[str]) -> Dict[str, Any]:
+    """Handle GET /products/{product_id}"""
+    product = ProductService.get_product(product_id)
+    if not product:
+        return not_found_response("Product not found")
+    return success_response(product)
+
+
+def handle_post(event: Dict[str, Any], product_id: Optional[str]) -> Dict[str, Any]:
+    """Handle POST /products"""
+    data = parse_json_body(event)
+
+    # A JSON array is a bulk import; nothing is written unless every product is valid
+    if isinstance(data, list):
+        products = ProductService.bulk_create_products(data)
+        return created_response(products, f"{len(products)} products created successfully")
+
+    # Create new product
+    product = ProductService.create_product(data)
+    return created_response(product, "Product created successfully")
+
+
+def handle_put(event: Dict[str, Any], product_id: Optional[str]) -> Dict[str, Any]:
+    """Handle PUT /products/{product_id}"""
+    # Update product
+    data = parse_json_body(event)
+    product = ProductService.update_product(product_id, data)
+    if not product:
+        return not_found_response("Product not found")
+    return success_response(product, "Product updated successfully")
+
+
+def handle_delete(event: Dict[str, Any], product_id: Optional[str]) -> Dict[str, Any]:
+    """Handle DELETE /products/{product_id}"""
+    # Delete product
+    deleted = ProductService.delete_product(product_id)
+    if not deleted:
+        return not_found_response("Product not found")
+    return success_response(None, "Product deleted successfully")
+
+
+def get_route_template(event: Dict[str, Any]) -> str:
+    """
+    Get the matched route template, e.g. '/products/{id}/stock'.
+    REST API (v1) events carry it in 'resource'; HTTP API (v2) events in
+    'routeKey' after the method ('PATCH /products/{id}/stock').
+    """
+    resource = event.get('resource')
+    if resource:
+        return resource
+    return event.get('routeKey', '').partition(' ')[2]
+
+
 def handle_products_by_brand(event: Dict[str, Any], brand_id: str) -> Dict[str, Any]:
     """Handle GET /products/by-brand/{brand_id}"""
 
     limit = int(get_query_parameter(event, 'limit', 50))
-    last_key = get_query_parameter(event, 'last_key')
-
-    # Parse last_key if provided
-    last_evaluated_key = None
-    if last_key:
-        try:
-            last_evaluated_key = json.loads(last_key)
-        except json.JSONDecodeError:
-            return bad_request_response("Invalid last_key format")
+    last_evaluated_key = get_last_evaluated_key(event)
 
     products_data = ProductService.list_products_by_brand(brand_id, limit, last_evaluated_key)
     return success_response(products_data)
@@ -158,15 +150,7 @@ def handle_products_by_category(event: Dict[str, Any], category_id: str) -> Dict
     """Handle GET /products/by-category/{category_id}"""
 
     limit = int(get_query_parameter(event, 'limit', 50))
-    last_key = get_query_parameter(event, 'last_key')
-
-    # Parse last_key if provided
-    last_evaluated_key = None
-    if last_key:
-        try:
-            last_evaluated_key = json.loads(last_key)
-        except json.JSONDecodeError:
-            return bad_request_response("Invalid last_key format")
+    last_evaluated_key = get_last_evaluated_key(event)
 
     products_data = ProductService.list_products_by_category(category_id, limit, last_evaluated_key)
     return success_response(products_data)
@@ -207,3 +191,29 @@ def handle_stock_update(event: Dict[str, Any], product_id: str) -> Dict[str, Any
 
     else:
         return bad_request_response("Either stock_quantity or quantity_change is required")
+
+
+def handle_missing_id(event: Dict[str, Any], product_id: Optional[str]) -> Dict[str, Any]:
+    """Handle PUT/DELETE /products without a product ID"""
+    return bad_request_response("Product ID is required")
+
+
+# Dispatch table for the standard CRUD routes, keyed on (HTTP method, has an ID)
+# so the list/single-item split is resolved once here instead of per request
+CRUD_ROUTES = {
+    ('GET', False): handle_list,
+    ('GET', True): handle_get,
+    ('POST', False): handle_post,
+    ('POST', True): handle_post,
+    ('PUT', False): handle_missing_id,
+    ('PUT', True): handle_put,
+    ('DELETE', False): handle_missing_id,
+    ('DELETE', True): handle_delete
+}
+
+# Sub-resource route template -> (path parameter, message if missing, handler)
+SUB_RESOURCE_ROUTES = {
+    '/products/by-brand/{brand_id}': ('brand_id', "Brand ID is required", handle_products_by_brand),
+    '/products/by-category/{category_id}': ('category_id', "Category ID is required", handle_products_by_category),
+    '/products/{id}/stock': ('id', "Product ID is required", handle_stock_update)
+}
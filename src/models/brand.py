@@ -1,19 +1,31 @@
-import uuid
 import re
-from datetime import datetime
-from typing import Optional, Dict, Any, cast
-import urllib.parse
+import string
+from typing import Optional, Dict, Any, Tuple, cast
 
 from utils.db_operations import db_client
 from utils.exceptions import ValidationError, NotFoundError, DuplicateError
 from config.settings import (
     BRAND_PREFIX,
     create_brand_item,
-    get_brand_pk,
-    get_brand_sk
+    generate_id,
+    get_brand_keys,
+    utc_now_iso
 )
 
 
+# Allowed brand name characters: letters, digits, whitespace, - _ & .
+_NAME_PATTERN = re.compile(r'[a-zA-Z0-9\s\-_&.]+')
+# ASCII subset of the pattern; set containment avoids the regex engine for typical names
+_NAME_ALLOWED_ASCII = frozenset(string.ascii_letters + string.digits + string.whitespace + '-_&.')
+
+# Conditional write guard: an update must not create a brand that isn't there,
+# and a delete only reports success for a brand that was there
+_BRAND_EXISTS_CONDITION = 'attribute_exists(PK)'
+
+# Fields update() accepts
+_UPDATABLE_FIELDS = frozenset({'name', 'description', 'website'})
+
+
 class Brand:
     """Brand model for single table design"""
 
@@ -37,7 +49,7 @@ class Brand:
             ValidationError: If validation fails
             DuplicateError: If brand name already exists
         """
-        Brand._validate_data(name, description, website)
+        name, description = Brand._validate_data(name, description, website)
 
         if Brand._name_exists(name):
             raise DuplicateError(f"Brand name '{name}' already exists")
@@ -65,8 +77,7 @@ class Brand:
         if not brand_id:
             return None
 
-        pk = get_brand_pk(brand_id)
-        sk = get_brand_sk(brand_id)
+        pk, sk = get_brand_keys(brand_id)
 
         result = db_client.get_item(pk, sk)
         return cast(Optional[Dict[str, Any]], result)
@@ -88,42 +99,45 @@ class Brand:
             ValidationError: If validation fails
             DuplicateError: If trying to update to existing name
         """
-        if not Brand.exists(brand_id):
+        if not brand_id:
             raise NotFoundError(f"Brand with ID '{brand_id}' not found")
 
-        allowed_fields = {'name', 'description', 'website'}
-        invalid_fields = set(updates.keys()) - allowed_fields
+        invalid_fields = updates.keys() - _UPDATABLE_FIELDS
         if invalid_fields:
             raise ValidationError(f"Invalid fields: {', '.join(invalid_fields)}")
 
         if 'name' in updates:
-            Brand._validate_name(updates['name'])
+            updates['name'] = Brand._validate_name(updates['name'])
             if Brand._name_exists(updates['name'], exclude_brand_id=brand_id):
                 raise DuplicateError(f"Brand name '{updates['name']}' already exists")
 
         if 'description' in updates:
-            Brand._validate_description(updates['description'])
+            updates['description'] = Brand._validate_description(updates['description'])
 
         if 'website' in updates:
             Brand._validate_website(updates['website'])
 
         # Add updated_at timestamp
-        updates['updated_at'] = datetime.utcnow().isoformat()
+        updates['updated_at'] = utc_now_iso()
 
         # If name is being updated, also update GSI3SK for sorting
         if 'name' in updates:
             updates['GSI3SK'] = updates['name'].upper()
 
-        pk = get_brand_pk(brand_id)
-        sk = get_brand_sk(brand_id)
+        pk, sk = get_brand_keys(brand_id)
 
-        result = db_client.update_item(pk, sk, updates)
+        # The existence check rides on the write itself instead of a prior GetItem
+        try:
+            result = db_client.update_item(pk, sk, updates,
+                                           condition_expression=_BRAND_EXISTS_CONDITION)
+        except NotFoundError:
+            raise NotFoundError(f"Brand with ID '{brand_id}' not found")
         return cast(Dict[str, Any], result)
 
     @staticmethod
     def delete(brand_id: str) -> bool:
         """
-        Delete a brand iem
+        Delete a brand item
 
         Args:
             brand_id: Brand ID
@@ -131,14 +145,17 @@ class Brand:
         Returns:
             True if deleted, False if not found
         """
-        if not Brand.exists(brand_id):
+        if not brand_id:
             return False
 
-        pk = get_brand_pk(brand_id)
-        sk = get_brand_sk(brand_id)
+        pk, sk = get_brand_keys(brand_id)
 
-        deleted_item = db_client.delete_item(pk, sk)
-        return deleted_item is not None
+        # The condition reports a missing brand, so the old item needn't come back
+        try:
+            db_client.delete_item(pk, sk, condition_expression=_BRAND_EXISTS_CONDITION, return_values='NONE')
+        except NotFoundError:
+            return False
+        return True
 
     @staticmethod
     def exists(brand_id: str) -> bool:
@@ -154,8 +171,7 @@ class Brand:
         if not brand_id:
             return False
 
-        pk = get_brand_pk(brand_id)
-        sk = get_brand_sk(brand_id)
+        pk, sk = get_brand_keys(brand_id)
 
         return db_client.check_item_exists(pk, sk)
 
@@ -176,11 +192,11 @@ class Brand:
     # Helper methods
     @staticmethod
     def _generate_id() -> str:
-        """Generate a unique brand ID"""
-        return str(uuid.uuid4())
+        """Generate a unique brand ID (UUID4 as 32 hex chars, no dashes)"""
+        return generate_id()
 
     @staticmethod
-    def _validate_data(name: str, description: str, website: Optional[str] = None) -> None:
+    def _validate_data(name: str, description: str, website: Optional[str] = None) -> Tuple[str, str]:
         """
         Validate brand data
 
@@ -189,17 +205,21 @@ class Brand:
             description: Brand description
             website: Brand website URL
 
+        Returns:
+            The stripped name and description
+
         Raises:
             ValidationError: If validation fails
         """
-        Brand._validate_name(name)
-        Brand._validate_description(description)
+        name = Brand._validate_name(name)
+        description = Brand._validate_description(description)
         if website is not None:
             Brand._validate_website(website)
+        return name, description
 
     @staticmethod
-    def _validate_name(name: str) -> None:
-        """Validate brand name"""
+    def _validate_name(name: str) -> str:
+        """Validate brand name and return it stripped"""
         if not name:
             raise ValidationError("Brand name is required")
 
@@ -207,22 +227,25 @@ class Brand:
             raise ValidationError("Brand name must be a string")
 
         name = name.strip()
-        if not name:
-            raise ValidationError("Brand name cannot be empty or whitespace")
-
-        if len(name) < 2:
-            raise ValidationError("Brand name must be at least 2 characters long")
-
-        if len(name) > 100:
+        length = len(name)
+        # One range check on the common valid path; pick the message only on failure
+        if not 2 <= length <= 100:
+            if not length:
+                raise ValidationError("Brand name cannot be empty or whitespace")
+            if length < 2:
+                raise ValidationError("Brand name must be at least 2 characters long")
             raise ValidationError("Brand name cannot exceed 100 characters")
 
         # Check for valid characters (letters, numbers, spaces, hyphens, underscores)
-        if not re.match(r'^[a-zA-Z0-9\s\-_&.]+$', name):
+        # The regex only decides names the ASCII set rejects (e.g. Unicode whitespace)
+        if not _NAME_ALLOWED_ASCII.issuperset(name) and not _NAME_PATTERN.fullmatch(name):
             raise ValidationError("Brand name contains invalid characters")
 
+        return name
+
     @staticmethod
-    def _validate_description(description: str) -> None:
-        """Validate brand description"""
+    def _validate_description(description: str) -> str:
+        """Validate brand description and return it stripped"""
         if not description:
             raise ValidationError("Brand description is required")
 
@@ -230,15 +253,16 @@ class Brand:
             raise ValidationError("Brand description must be a string")
 
         description = description.strip()
-        if not description:
-            raise ValidationError("Brand description cannot be empty or whitespace")
-
-        if len(description) < 10:
-            raise ValidationError("Brand description must be at least 10 characters long")
-
-        if len(description) > 500:
+        length = len(description)
+        if not 10 <= length <= 500:
+            if not length:
+                raise ValidationError("Brand description cannot be empty or whitespace")
+            if length < 10:
+                raise ValidationError("Brand description must be at least 10 characters long")
             raise ValidationError("Brand description cannot exceed 500 characters")
 
+        return description
+
     @staticmethod
     def _validate_website(website: str) -> None:
         """Validate brand website URL"""
@@ -252,9 +276,11 @@ class Brand:
         if not website:
             return  # Empty string is acceptable for optional field
 
-        # Use built-in urllib.parse for URL validation
+        # Imported lazily: most create/update calls carry no website
+        from urllib.parse import urlparse
+
         try:
-            parsed = urllib.parse.urlparse(website)
+            parsed = urlparse(website)
             if not all([parsed.scheme, parsed.netloc]):
                 raise ValidationError("Invalid website URL format")
             if parsed.scheme not in ('http', 'https'):
@@ -277,26 +303,10 @@ class Brand:
         if not name:
             return False
 
-        # Query GSI-3 to find brands with similar names
-        # We'll check case-insensitive by querying and then comparing
-        try:
-            result = db_client.query_gsi3(Brand.LIST_PREFIX, limit=100)  # Get all brands
-
-            name_upper = name.strip().upper()
+        # GSI3SK holds the uppercased name, so an exact key match is a
+        # case-insensitive name lookup done by DynamoDB
+        matches = db_client.query_gsi3_eq(Brand.LIST_PREFIX, name.strip().upper(),
+                                          projection='brand_id')
 
-            for item in result.get('items', []):
-                existing_name = item.get('name', '').strip().upper()
-                existing_brand_id = item.get('brand_id')
-
-                # Skip if this is the brand being updated
-                if exclude_brand_id and existing_brand_id == exclude_brand_id:
-                    continue
-
-                if existing_name == name_upper:
-                    return True
-
-            return False
-
-        except Exception:
-            # If query fails, assume name doesn't exist to avoid blocking creation
-            return False
+        # Skip the brand being updated
+        return any(item.get('brand_id') != exclude_brand_id for item in matches)
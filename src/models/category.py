@@ -1,18 +1,30 @@
-import uuid
 import re
-from datetime import datetime
-from typing import Optional, Dict, Any, cast
+import string
+from typing import Optional, Dict, Any, Tuple, cast
 
 from utils.db_operations import db_client
 from utils.exceptions import ValidationError, NotFoundError, DuplicateError
 from config.settings import (
     CATEGORY_PREFIX,
     create_category_item,
-    get_category_pk,
-    get_category_sk
+    generate_id,
+    get_category_keys,
+    utc_now_iso
 )
 
 
+# Allowed category name characters: letters, digits, whitespace, - _ & .
+_NAME_PATTERN = re.compile(r'[a-zA-Z0-9\s\-_&.]+')
+# ASCII subset of the pattern; set containment avoids the regex engine for typical names
+_NAME_ALLOWED_ASCII = frozenset(string.ascii_letters + string.digits + string.whitespace + '-_&.')
+
+# Conditional write guard: a delete only reports success for a category that was there
+_CATEGORY_EXISTS_CONDITION = 'attribute_exists(PK)'
+
+# Fields update() accepts
+_UPDATABLE_FIELDS = frozenset({'name', 'description'})
+
+
 class Category:
     """Category model for the single table design"""
 
@@ -36,7 +48,7 @@ class Category:
             ValidationError: If validation fails
             DuplicateError: If category name already exists
         """
-        Category._validate_data(name, description)
+        name, description = Category._validate_data(name, description)
 
         if Category._name_exists(name):
             raise DuplicateError(f"Category name '{name}' already exists")
@@ -64,8 +76,7 @@ class Category:
         if not category_id:
             return None
 
-        pk = get_category_pk(category_id)
-        sk = get_category_sk(category_id)
+        pk, sk = get_category_keys(category_id)
 
         result = db_client.get_item(pk, sk)
         return cast(Optional[Dict[str, Any]], result)
@@ -87,34 +98,37 @@ class Category:
             ValidationError: If validation fails
             DuplicateError: If trying to update to existing name
         """
-        if not Category.exists(category_id):
+        if not category_id:
             raise NotFoundError(f"Category with ID '{category_id}' not found")
 
-        allowed_fields = {'name', 'description'}
-        invalid_fields = set(updates.keys()) - allowed_fields
+        invalid_fields = updates.keys() - _UPDATABLE_FIELDS
         if invalid_fields:
             raise ValidationError(f"Invalid fields: {', '.join(invalid_fields)}")
 
         if 'name' in updates:
-            Category._validate_name(updates['name'])
+            updates['name'] = Category._validate_name(updates['name'])
             if Category._name_exists(updates['name'], exclude_category_id=category_id):
                 raise DuplicateError(f"Category name '{updates['name']}' already exists")
 
         if 'description' in updates:
-            Category._validate_description(updates['description'])
+            updates['description'] = Category._validate_description(updates['description'])
 
 
         # Add updated_at timestamp
-        updates['updated_at'] = datetime.utcnow().isoformat()
+        updates['updated_at'] = utc_now_iso()
 
         # If name is being updated, also update GSI3SK for sorting
         if 'name' in updates:
             updates['GSI3SK'] = updates['name'].upper()
 
-        pk = get_category_pk(category_id)
-        sk = get_category_sk(category_id)
+        pk, sk = get_category_keys(category_id)
 
-        result = db_client.update_item(pk, sk, updates)
+        # Existence and "anything changed" ride on the write itself instead of a
+        # prior GetItem; a no-op update returns the stored category untouched
+        try:
+            result, _ = db_client.update_item_if_changed(pk, sk, updates, _UPDATABLE_FIELDS)
+        except NotFoundError:
+            raise NotFoundError(f"Category with ID '{category_id}' not found")
         return cast(Dict[str, Any], result)
 
     @staticmethod
@@ -128,14 +142,17 @@ class Category:
         Returns:
             True if deleted, False if not found
         """
-        if not Category.exists(category_id):
+        if not category_id:
             return False
 
-        pk = get_category_pk(category_id)
-        sk = get_category_sk(category_id)
+        pk, sk = get_category_keys(category_id)
 
-        deleted_item = db_client.delete_item(pk, sk)
-        return deleted_item is not None
+        # The condition reports a missing category, so the old item needn't come back
+        try:
+            db_client.delete_item(pk, sk, condition_expression=_CATEGORY_EXISTS_CONDITION, return_values='NONE')
+        except NotFoundError:
+            return False
+        return True
 
     @staticmethod
     def exists(category_id: str) -> bool:
@@ -151,8 +168,7 @@ class Category:
         if not category_id:
             return False
 
-        pk = get_category_pk(category_id)
-        sk = get_category_sk(category_id)
+        pk, sk = get_category_keys(category_id)
 
         return db_client.check_item_exists(pk, sk)
 
@@ -173,11 +189,11 @@ class Category:
     # Helper methods
     @staticmethod
     def _generate_id() -> str:
-        """Generate a unique category ID"""
-        return str(uuid.uuid4())
+        """Generate a unique category ID (UUID4 as 32 hex chars, no dashes)"""
+        return generate_id()
 
     @staticmethod
-    def _validate_data(name: str, description: str) -> None:
+    def _validate_data(name: str, description: str) -> Tuple[str, str]:
         """
         Validate category data
 
@@ -185,16 +201,18 @@ class Category:
             name: Category name
             description: Category description
 
+        Returns:
+            The stripped name and description
+
         Raises:
             ValidationError: If validation fails
         """
-        Category._validate_name(name)
-        Category._validate_description(description)
+        return Category._validate_name(name), Category._validate_description(description)
 
 
     @staticmethod
-    def _validate_name(name: str) -> None:
-        """Validate category name"""
+    def _validate_name(name: str) -> str:
+        """Validate category name and return it stripped"""
         if not name:
             raise ValidationError("Category name is required")
 
@@ -202,22 +220,25 @@ class Category:
             raise ValidationError("Category name must be a string")
 
         name = name.strip()
-        if not name:
-            raise ValidationError("Cagegory name cannot be empty or whitespace")
-
-        if len(name) < 2:
-            raise ValidationError("Category name must be at least 2 characters long")
-
-        if len(name) > 100:
+        length = len(name)
+        # One range check on the common valid path; pick the message only on failure
+        if not 2 <= length <= 100:
+            if not length:
+                raise ValidationError("Cagegory name cannot be empty or whitespace")
+            if length < 2:
+                raise ValidationError("Category name must be at least 2 characters long")
             raise ValidationError("Category name cannot exceed 100 characters")
 
         # Check for valid characters (letters, numbers, spaces, hyphens, underscores)
-        if not re.match(r'^[a-zA-Z0-9\s\-_&.]+$', name):
+        # The regex only decides names the ASCII set rejects (e.g. Unicode whitespace)
+        if not _NAME_ALLOWED_ASCII.issuperset(name) and not _NAME_PATTERN.fullmatch(name):
             raise ValidationError("Category name contains invalid characters")
 
+        return name
+
     @staticmethod
-    def _validate_description(description: str) -> None:
-        """Validate category description"""
+    def _validate_description(description: str) -> str:
+        """Validate category description and return it stripped"""
         if not description:
             raise ValidationError("Category description is required")
 
@@ -225,15 +246,16 @@ class Category:
             raise ValidationError("Category description must be a string")
 
         description = description.strip()
-        if not description:
-            raise ValidationError("Category description cannot be empty or whitespace")
-
-        if len(description) < 10:
-            raise ValidationError("Category description must be at least 10 characters long")
-
-        if len(description) > 500:
+        length = len(description)
+        if not 10 <= length <= 500:
+            if not length:
+                raise ValidationError("Category description cannot be empty or whitespace")
+            if length < 10:
+                raise ValidationError("Category description must be at least 10 characters long")
             raise ValidationError("Category description cannot exceed 500 characters")
 
+        return description
+
 
     @staticmethod
     def _name_exists(name: str, exclude_category_id: Optional[str] = None) -> bool:
@@ -250,26 +272,10 @@ class Category:
         if not name:
             return False
 
-        # Query GSI-3 to find categories with similar names
-        # We'll check case-insensitive by querying and then comparing
-        try:
-            result = db_client.query_gsi3(Category.LIST_PREFIX, limit=100)  # Get all categories
-
-            name_upper = name.strip().upper()
-
-            for item in result.get('items', []):
-                existing_name = item.get('name', '').strip().upper()
-                existing_category_id = item.get('category_id')
-
-                # Skip if this is the category being updated
-                if exclude_category_id and existing_category_id == exclude_category_id:
-                    continue
-
-                if existing_name == name_upper:
-                    return True
+        # GSI3SK holds the uppercased name, so an exact key match is a
+        # case-insensitive name lookup done by DynamoDB
+        matches = db_client.query_gsi3_eq(Category.LIST_PREFIX, name.strip().upper(),
+                                          projection='category_id')
 
-            return False
-
-        except Exception:
-            # If query fails, assume name doesn't exist to avoid blocking creation
-            return False
+        # Skip the category being updated
+        return any(item.get('category_id') != exclude_category_id for item in matches)
@@ -1,19 +1,111 @@
-import uuid
 import re
-from datetime import datetime
-from typing import Optional, Dict, Any, List, cast
+import string
+import time
+from typing import Optional, Dict, Any, List, Set, Callable, cast
 from decimal import Decimal
 
 from utils.db_operations import db_client
 from utils.exceptions import ValidationError, NotFoundError
 from config.settings import (
+    PK_FIELD,
     PRODUCT_PREFIX,
     create_product_item,
-    get_product_pk,
-    get_product_sk
+    create_product_list_item,
+    generate_id,
+    get_brand_keys,
+    get_category_keys,
+    get_product_keys,
+    get_product_list_keys,
+    utc_now_iso
 )
 
 
+# Conditional write guard: a stock update must not create a phantom product,
+# and a delete only reports success for a product that was there
+_PRODUCT_EXISTS_CONDITION = 'attribute_exists(PK)'
+
+# Fields update() accepts
+_UPDATABLE_FIELDS = frozenset({'name', 'brand_id', 'category_id', 'price', 'description', 'stock_quantity', 'images'})
+
+# Compiled at import so the work lands in Lambda init (and the SnapStart snapshot);
+# unanchored because they are applied with fullmatch()
+_NAME_PATTERN = re.compile(r'[a-zA-Z0-9\s\-_&.,()\'"/!+]+')
+# ASCII subset of the name pattern; set containment avoids the regex engine for typical names
+_NAME_ALLOWED_ASCII = frozenset(string.ascii_letters + string.digits + string.whitespace + '-_&.,()\'"/!+')
+_IMAGE_URL_PATTERN = re.compile(r'https?://.+\.(jpg|jpeg|png|gif|webp)(\?.*)?', re.IGNORECASE)
+# Product attributes mirrored onto the PRODUCT_LIST item on update
+_LIST_ITEM_FIELDS = frozenset({
+    'name', 'brand_id', 'category_id', 'price', 'description',
+    'stock_quantity', 'images', 'updated_at'
+})
+# Public product attributes; list queries project to these so storage keys
+# (PK/SK, GSI keys) never cross the wire or get deserialized. entity_type stays:
+# by-brand results hold both the product and its list row, and it tells them apart
+_LIST_PROJECTION = (
+    'product_id', 'entity_type', 'name', 'brand_id', 'category_id', 'price',
+    'description', 'stock_quantity', 'images', 'created_at', 'updated_at'
+)
+
+# Brand/category IDs: UUIDs as 32 hex chars (current) or the dashed form (older items)
+_UUID_PATTERN = re.compile(
+    r'[0-9a-fA-F]{32}|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+)
+
+# Brand/category IDs confirmed to exist, mapped to when that expires (time.monotonic()).
+# Kept at module scope so warm containers reuse them. Only hits are cached, so an
+# unknown ID is always re-read; a deleted one may still pass for up to the TTL.
+_EXISTS_CACHE_TTL = 60.0
+_EXISTS_CACHE_MAXSIZE = 2048
+_brand_exists_cache: Dict[str, float] = {}
+_category_exists_cache: Dict[str, float] = {}
+
+
+def _cached_exists(cache: Dict[str, float], key: str, pk: str, sk: str) -> bool:
+    """Existence check that serves recent hits from `cache` instead of DynamoDB"""
+    now = time.monotonic()
+    expires_at = cache.get(key)
+    if expires_at is not None and expires_at > now:
+        return True
+
+    cache.pop(key, None)
+    if not db_client.check_item_exists(pk, sk):
+        return False
+
+    _remember_exists(cache, key, now)
+    return True
+
+
+def _remember_exists(cache: Dict[str, float], key: str, now: float) -> None:
+    """Record a confirmed ID in `cache`, evicting the oldest entry when full"""
+    # Dicts keep insertion order, so the first key is the oldest entry
+    if len(cache) >= _EXISTS_CACHE_MAXSIZE:
+        del cache[next(iter(cache))]
+    cache[key] = now + _EXISTS_CACHE_TTL
+
+
+def _missing_ids(cache: Dict[str, float], ids: Set[str], get_keys: Callable) -> Set[str]:
+    """
+    Return the IDs in `ids` with no item, reading all uncached ones in
+    batched GetItems and caching the ones that exist
+    """
+    now = time.monotonic()
+    unchecked = [key for key in ids if cache.get(key, 0.0) <= now]
+    if not unchecked:
+        return set()
+
+    keys_by_pk = {get_keys(key)[0]: key for key in unchecked}
+    found = db_client.batch_get_items(
+        [{'pk': pk, 'sk': sk} for pk, sk in map(get_keys, unchecked)],
+        projection=PK_FIELD
+    )
+
+    existing = {keys_by_pk[item[PK_FIELD]] for item in found}
+    for key in existing:
+        cache.pop(key, None)
+        _remember_exists(cache, key, now)
+    return set(unchecked) - existing
+
+
 class Product:
     """Product model for single table design"""
 
@@ -58,18 +150,77 @@ class Product:
             description, stock_quantity, images
         )
 
-        from config.settings import create_product_list_item
         product_list_item = create_product_list_item(
             product_id, name, brand_id, category_id, price,
             description, stock_quantity, images
         )
 
-        # Save both items to database
-        db_client.put_item(product_item)
-        db_client.put_item(product_list_item)
+        # Save both items in one round trip; the transaction keeps them in step
+        db_client.transact_write_items(items_to_put=[product_item, product_list_item])
 
         return product_item
 
+    @staticmethod
+    def bulk_create(products: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create many products at once (for imports), with batched reads and writes
+
+        Every product is validated and every referenced brand and category is
+        checked before anything is written. The writes go out as BatchWriteItem
+        chunks and are not atomic across chunks.
+
+        Args:
+            products: One dict per product with the arguments create() takes
+                (name, brand_id, category_id, price, and optional description,
+                stock_quantity, images)
+
+        Returns:
+            Created product items, in input order
+
+        Raises:
+            ValidationError: If any product fails validation
+            NotFoundError: If a referenced brand_id or category_id doesn't exist
+        """
+        products = [
+            {
+                'name': product.get('name'),
+                'brand_id': product.get('brand_id'),
+                'category_id': product.get('category_id'),
+                'price': product.get('price'),
+                'description': product.get('description'),
+                'stock_quantity': product.get('stock_quantity', 0),
+                'images': product.get('images')
+            }
+            for product in products
+        ]
+        for product in products:
+            Product._validate_data(**product)
+
+        missing_brands = _missing_ids(
+            _brand_exists_cache, {product['brand_id'] for product in products}, get_brand_keys
+        )
+        if missing_brands:
+            raise NotFoundError(f"Brand with ID '{min(missing_brands)}' not found")
+
+        missing_categories = _missing_ids(
+            _category_exists_cache, {product['category_id'] for product in products}, get_category_keys
+        )
+        if missing_categories:
+            raise NotFoundError(f"Category with ID '{min(missing_categories)}' not found")
+
+        items_to_put = []
+        created = []
+        for product in products:
+            product_id = Product._generate_id()
+            product_item = create_product_item(product_id, **product)
+            items_to_put.append(product_item)
+            items_to_put.append(create_product_list_item(product_id, **product))
+            created.append(product_item)
+
+        db_client.batch_write_items(items_to_put=items_to_put)
+
+        return created
+
     @staticmethod
     def get(product_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -84,8 +235,7 @@ class Product:
         if not product_id:
             return None
 
-        pk = get_product_pk(product_id)
-        sk = get_product_sk(product_id)
+        pk, sk = get_product_keys(product_id)
 
         result = db_client.get_item(pk, sk)
         return cast(Optional[Dict[str, Any]], result)
@@ -106,11 +256,10 @@ class Product:
             NotFoundError: If product doesn't exist
             ValidationError: If validation fails
         """
-        if not Product.exists(product_id):
+        if not product_id:
             raise NotFoundError(f"Product with ID '{product_id}' not found")
 
-        allowed_fields = {'name', 'brand_id', 'category_id', 'price', 'description', 'stock_quantity', 'images'}
-        invalid_fields = set(updates.keys()) - allowed_fields
+        invalid_fields = updates.keys() - _UPDATABLE_FIELDS
         if invalid_fields:
             raise ValidationError(f"Invalid fields: {', '.join(invalid_fields)}")
 
@@ -140,33 +289,123 @@ class Product:
             Product._validate_images(updates['images'])
 
         # Add updated_at timestamp
-        updates['updated_at'] = datetime.utcnow().isoformat()
+        updates['updated_at'] = utc_now_iso()
 
         # If category_id is being updated, also update GSI3PK for category queries
         if 'category_id' in updates:
             updates['GSI3PK'] = f"CATEGORY#{updates['category_id']}"
 
-        pk = get_product_pk(product_id)
-        sk = get_product_sk(product_id)
+        pk, sk = get_product_keys(product_id)
 
-        result = db_client.update_item(pk, sk, updates)
-        if result is None:
+        # Existence and "anything changed" ride on the write itself instead of a
+        # prior GetItem; a no-op update returns the stored product untouched and
+        # skips the list item write
+        try:
+            result, changed = db_client.update_item_if_changed(pk, sk, updates, _UPDATABLE_FIELDS)
+        except NotFoundError:
             raise NotFoundError(f"Product with ID '{product_id}' not found")
+        if not changed:
+            return cast(Dict[str, Any], result)
 
         # Also update the product list item
-        list_pk = f"PRODUCT_LIST#{product_id}"
-        list_sk = f"PRODUCT_LIST#{product_id}"
-        list_updates = updates.copy()
+        list_pk, list_sk = get_product_list_keys(product_id)
+        # Only mirrored attributes; this leaves out the category-based GSI3PK so
+        # the list item keeps GSI3PK = "PRODUCT_LIST" for list queries
+        list_updates = {key: value for key, value in updates.items() if key in _LIST_ITEM_FIELDS}
 
         if 'name' in updates:
             list_updates['GSI3SK'] = updates['name'].upper()
-        
-        # Ensure product_list_item keeps GSI3PK = "PRODUCT_LIST" for list queries
-        # (Don't copy the category-based GSI3PK from the main product item)
-        if 'GSI3PK' in list_updates:
-            del list_updates['GSI3PK']
 
-        db_client.update_item(list_pk, list_sk, list_updates)
+        db_client.update_item(list_pk, list_sk, list_updates, return_values='NONE')
+
+        return cast(Dict[str, Any], result)
+
+    @staticmethod
+    def set_stock(product_id: str, stock_quantity: int) -> Dict[str, Any]:
+        """
+        Set a product's stock to an absolute value in one conditional update
+
+        Args:
+            product_id: Product ID
+            stock_quantity: New stock quantity
+
+        Returns:
+            Updated product item
+
+        Raises:
+            NotFoundError: If product doesn't exist
+            ValidationError: If the stock quantity is invalid
+        """
+        if not product_id:
+            raise NotFoundError(f"Product with ID '{product_id}' not found")
+
+        Product._validate_stock_quantity(stock_quantity)
+
+        updates = {'stock_quantity': stock_quantity, 'updated_at': utc_now_iso()}
+
+        pk, sk = get_product_keys(product_id)
+
+        # Existence and "anything changed" ride on the write itself instead of a
+        # prior GetItem; a no-op update returns the stored product untouched and
+        # skips the list item write
+        try:
+            result, changed = db_client.update_item_if_changed(pk, sk, updates, _UPDATABLE_FIELDS)
+        except NotFoundError:
+            raise NotFoundError(f"Product with ID '{product_id}' not found")
+        if not changed:
+            return cast(Dict[str, Any], result)
+
+        list_pk, list_sk = get_product_list_keys(product_id)
+        db_client.update_item(list_pk, list_sk, updates, return_values='NONE')
+
+        return cast(Dict[str, Any], result)
+
+    @staticmethod
+    def adjust_stock(product_id: str, quantity_change: int) -> Dict[str, Any]:
+        """
+        Atomically adjust a product's stock by a relative amount
+
+        Args:
+            product_id: Product ID
+            quantity_change: Amount to add (positive) or subtract (negative)
+
+        Returns:
+            Updated product item
+
+        Raises:
+            NotFoundError: If product doesn't exist
+            ValidationError: If the adjustment would leave stock out of range
+        """
+        if not product_id:
+            raise NotFoundError(f"Product with ID '{product_id}' not found")
+
+        if isinstance(quantity_change, bool) or not isinstance(quantity_change, int):
+            raise ValidationError("Quantity change must be an integer")
+
+        updated_at = utc_now_iso()
+
+        pk, sk = get_product_keys(product_id)
+
+        try:
+            result = db_client.increment_attribute(
+                pk, sk, 'stock_quantity', quantity_change,
+                min_value=0, max_value=999999,
+                updates={'updated_at': updated_at}
+            )
+        except NotFoundError:
+            raise NotFoundError(f"Product with ID '{product_id}' not found")
+        except ValidationError:
+            if quantity_change < 0:
+                raise ValidationError("Stock quantity cannot be negative after adjustment")
+            raise ValidationError("Stock quantity cannot exceed 999,999")
+
+        # Mirror the authoritative value onto the product list item; nothing
+        # reads the response, so don't ask DynamoDB to send the item back
+        list_pk, list_sk = get_product_list_keys(product_id)
+        db_client.update_item(list_pk, list_sk, {
+            'stock_quantity': result['stock_quantity'],
+            'updated_at': updated_at
+        }, return_values='NONE')
 
         return cast(Dict[str, Any], result)
 
@@ -181,19 +420,24 @@ class Product:
         Returns:
             True if deleted, False if not found
         """
-        if not Product.exists(product_id):
+        if not product_id:
             return False
 
-        pk = get_product_pk(product_id)
-        sk = get_product_sk(product_id)
+        pk, sk = get_product_keys(product_id)
 
-        deleted_item = db_client.delete_item(pk, sk)
+        list_pk, list_sk = get_product_list_keys(product_id)
 
-        list_pk = f"PRODUCT_LIST#{product_id}"
-        list_sk = f"PRODUCT_LIST#{product_id}"
-        db_client.delete_item(list_pk, list_sk)
+        # One transaction replaces the existence read and two deletes; the
+        # condition cancels it (leaving both items alone) if the product is gone
+        try:
+            db_client.transact_write_items(items_to_delete=[
+                {'pk': pk, 'sk': sk, 'condition_expression': _PRODUCT_EXISTS_CONDITION},
+                {'pk': list_pk, 'sk': list_sk}
+            ])
+        except NotFoundError:
+            return False
 
-        return deleted_item is not None
+        return True
 
     @staticmethod
     def exists(product_id: str) -> bool:
@@ -209,8 +453,7 @@ class Product:
         if not product_id:
             return False
 
-        pk = get_product_pk(product_id)
-        sk = get_product_sk(product_id)
+        pk, sk = get_product_keys(product_id)
 
         return db_client.check_item_exists(pk, sk)
 
@@ -226,7 +469,7 @@ class Product:
         Returns:
             Dict with 'items' and 'last_evaluated_key'
         """
-        return db_client.list_products_by_name(limit, last_evaluated_key)
+        return db_client.list_products_by_name(limit, last_evaluated_key, _LIST_PROJECTION)
 
     @staticmethod
     def list_by_brand(brand_id: str, limit: int = 50, last_evaluated_key: Optional[Dict] = None) -> Dict[str, Any]:
@@ -241,7 +484,8 @@ class Product:
         Returns:
             Dict with 'items' and 'last_evaluated_key'
         """
-        return db_client.get_products_by_brand(brand_id, limit, last_evaluated_key)
+        return db_client.get_products_by_brand(brand_id, limit, last_evaluated_key,
+                                               _LIST_PROJECTION)
 
     @staticmethod
     def list_by_category(category_id: str, limit: int = 50, last_evaluated_key: Optional[Dict] = None) -> Dict[str, Any]:
@@ -256,14 +500,15 @@ class Product:
         Returns:
             Dict with 'items' and 'last_evaluated_key'
         """
-        return db_client.get_products_by_category(category_id, limit, last_evaluated_key)
+        return db_client.get_products_by_category(category_id, limit, last_evaluated_key,
+                                                  _LIST_PROJECTION)
 
 
     # Helper methods
     @staticmethod
     def _generate_id() -> str:
-        """Generate a unique product ID"""
-        return str(uuid.uuid4())
+        """Generate a unique product ID (UUID4 as 32 hex chars, no dashes)"""
+        return generate_id()
 
     @staticmethod
     def _validate_data(name: str, brand_id: str, category_id: str, price: float,
@@ -307,17 +552,18 @@ class Product:
             raise ValidationError("Product name must be a string")
 
         name = name.strip()
-        if not name:
-            raise ValidationError("Product name cannot be empty or whitespace")
-
-        if len(name) < 2:
-            raise ValidationError("Product name must be at least 2 characters long")
-
-        if len(name) > 200:
+        length = len(name)
+        # One range check on the common valid path; pick the message only on failure
+        if not 2 <= length <= 200:
+            if not length:
+                raise ValidationError("Product name cannot be empty or whitespace")
+            if length < 2:
+                raise ValidationError("Product name must be at least 2 characters long")
             raise ValidationError("Product name cannot exceed 200 characters")
 
         # Check for valid characters (letters, numbers, spaces, common punctuation)
-        if not re.match(r'^[a-zA-Z0-9\s\-_&.,()\'"/!+]+$', name):
+        # The regex only decides names the ASCII set rejects (e.g. Unicode whitespace)
+        if not _NAME_ALLOWED_ASCII.issuperset(name) and not _NAME_PATTERN.fullmatch(name):
             raise ValidationError("Product name contains invalid characters")
 
     @staticmethod
@@ -334,9 +580,7 @@ class Product:
             raise ValidationError("Brand ID cannot be empty or whitespace")
 
         # Basic UUID format validation
-        try:
-            uuid.UUID(brand_id)
-        except ValueError:
+        if not _UUID_PATTERN.fullmatch(brand_id):
             raise ValidationError("Brand ID must be a valid UUID")
 
     @staticmethod
@@ -353,9 +597,7 @@ class Product:
             raise ValidationError("Category ID cannot be empty or whitespace")
 
         # Basic UUID format validation
-        try:
-            uuid.UUID(category_id)
-        except ValueError:
+        if not _UUID_PATTERN.fullmatch(category_id):
             raise ValidationError("Category ID must be a valid UUID")
 
     @staticmethod
@@ -367,17 +609,17 @@ class Product:
         if not isinstance(price, (int, float, Decimal)):
             raise ValidationError("Price must be a number")
 
-        if float(price) < 0:
+        value = float(price)
+        if value < 0:
             raise ValidationError("Price cannot be negative")
 
-        if float(price) > 999999.99:
+        if value > 999999.99:
             raise ValidationError("Price cannot exceed 999,999.99")
 
-        # Check for reasonable decimal places (max 2)
-        if isinstance(price, float):
-            decimal_places = len(str(price).split('.')[-1]) if '.' in str(price) else 0
-            if decimal_places > 2:
-                raise ValidationError("Price cannot have more than 2 decimal places")
+        # Check for reasonable decimal places (max 2); round() is exact about
+        # this for floats, including ones whose str() uses scientific notation
+        if isinstance(price, float) and round(price, 2) != price:
+            raise ValidationError("Price cannot have more than 2 decimal places")
 
     @staticmethod
     def _validate_description(description: str) -> None:
@@ -389,13 +631,12 @@ class Product:
             raise ValidationError("Product description must be a string")
 
         description = description.strip()
-        if not description:
-            return  # Empty string is acceptable for optional field
-
-        if len(description) < 10:
-            raise ValidationError("Product description must be at least 10 characters long")
-
-        if len(description) > 1000:
+        length = len(description)
+        if not 10 <= length <= 1000:
+            if not length:
+                return  # Empty string is acceptable for optional field
+            if length < 10:
+                raise ValidationError("Product description must be at least 10 characters long")
             raise ValidationError("Product description cannot exceed 1000 characters")
 
 
@@ -440,17 +681,15 @@ class Product:
                 raise ValidationError(f"Image {i+1} URL cannot be empty")
 
             # Basic URL validation
-            if not re.match(r'^https?://.+\.(jpg|jpeg|png|gif|webp)(\?.*)?$', image_url, re.IGNORECASE):
+            if not _IMAGE_URL_PATTERN.fullmatch(image_url):
                 raise ValidationError(f"Image {i+1} must be a valid image URL (jpg, jpeg, png, gif, webp)")
 
     @staticmethod
     def _brand_exists(brand_id: str) -> bool:
         """Check if a brand exists"""
         try:
-            from config.settings import get_brand_pk, get_brand_sk
-            pk = get_brand_pk(brand_id)
-            sk = get_brand_sk(brand_id)
-            return db_client.check_item_exists(pk, sk)
+            pk, sk = get_brand_keys(brand_id)
+            return _cached_exists(_brand_exists_cache, brand_id, pk, sk)
         except Exception:
             return False
 
@@ -458,9 +697,7 @@ class Product:
     def _category_exists(category_id: str) -> bool:
         """Check if a category exists"""
         try:
-            from config.settings import get_category_pk, get_category_sk
-            pk = get_category_pk(category_id)
-            sk = get_category_sk(category_id)
-            return db_client.check_item_exists(pk, sk)
+            pk, sk = get_category_keys(category_id)
+            return _cached_exists(_category_exists_cache, category_id, pk, sk)
         except Exception:
             return False
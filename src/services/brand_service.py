@@ -21,8 +21,9 @@ class BrandService:
             ValidationError: If validation fails
             DuplicateError: If brand name already exists
         """
-        name = data.get('name', '').strip()
-        description = data.get('description', '').strip()
+        # Brand validation strips name and description
+        name = data.get('name', '')
+        description = data.get('description', '')
         website = data.get('website')
 
         if website:
@@ -65,10 +66,10 @@ class BrandService:
         updates = {}
 
         if 'name' in data:
-            updates['name'] = data['name'].strip()
+            updates['name'] = data['name']
 
         if 'description' in data:
-            updates['description'] = data['description'].strip()
+            updates['description'] = data['description']
 
         if 'website' in data:
             website = data['website']
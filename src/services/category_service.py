@@ -20,11 +20,8 @@ class CategoryService:
             ValidationError: If validation fails
             DuplicateError: If category name already exists
         """
-        name = data.get('name', '').strip()
-        description = data.get('description', '').strip()
-
-
-        return Category.create(name, description)
+        # Category validation strips name and description
+        return Category.create(data.get('name', ''), data.get('description', ''))
 
     @staticmethod
     def get_category(category_id: str) -> Optional[Dict[str, Any]]:
@@ -59,10 +56,10 @@ class CategoryService:
         updates = {}
 
         if 'name' in data:
-            updates['name'] = data['name'].strip()
+            updates['name'] = data['name']
 
         if 'description' in data:
-            updates['description'] = data['description'].strip()
+            updates['description'] = data['description']
 
         if not updates:
             raise ValidationError("No valid fields to update")
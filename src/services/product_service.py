@@ -1,6 +1,17 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from models.product import Product
-from utils.exceptions import ValidationError, NotFoundError
+from utils.exceptions import ValidationError
+
+# Identifying text fields, stripped on the way in; a new product needs all of them
+_TEXT_FIELDS = (
+    ('name', "Product name is required"),
+    ('brand_id', "Brand ID is required"),
+    ('category_id', "Category ID is required"),
+)
+
+# Most products one bulk request may create; keeps a request well inside the
+# API Gateway timeout and the Lambda payload limit
+_MAX_BULK_PRODUCTS = 100
 
 
 class ProductService:
@@ -21,41 +32,60 @@ class ProductService:
             ValidationError: If validation fails
             NotFoundError: If brand_id or category_id don't exist
         """
-        name = data.get('name', '').strip()
-        brand_id = data.get('brand_id', '').strip()
-        category_id = data.get('category_id', '').strip()
-        price = data.get('price')
+        return Product.create(**ProductService._prepare_new_product(data))
 
-        # Validate required fields
-        if not name:
-            raise ValidationError("Product name is required")
-        if not brand_id:
-            raise ValidationError("Brand ID is required")
-        if not category_id:
-            raise ValidationError("Category ID is required")
-        if price is None:
-            raise ValidationError("Price is required")
+    @staticmethod
+    def bulk_create_products(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create many products at once, e.g. for an import
 
-        # Optional fields
-        description = data.get('description')
-        if description:
-            description = description.strip()
-            if not description:
-                description = None
+        Args:
+            items: Product data dicts, each shaped like create_product's data
+
+        Returns:
+            Created products, in input order
+
+        Raises:
+            ValidationError: If any product fails validation (nothing is written)
+            NotFoundError: If a brand_id or category_id doesn't exist (nothing is written)
+        """
+        if not items:
+            raise ValidationError("At least one product is required")
 
-        stock_quantity = int(data.get('stock_quantity', 0))
+        if len(items) > _MAX_BULK_PRODUCTS:
+            raise ValidationError(f"At most {_MAX_BULK_PRODUCTS} products can be created at once")
 
-        images = data.get('images')
+        if not all(isinstance(data, dict) for data in items):
+            raise ValidationError("Each product must be a JSON object")
 
-        return Product.create(
-            name=name,
-            brand_id=brand_id,
-            category_id=category_id,
-            price=price,
-            description=description,
-            stock_quantity=stock_quantity,
-            images=images
-        )
+        return Product.bulk_create([ProductService._prepare_new_product(data) for data in items])
+
+    @staticmethod
+    def _prepare_new_product(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize and check the required fields of new-product data"""
+        prepared = {}
+        for field, required_message in _TEXT_FIELDS:
+            value = data.get(field, '').strip()
+            if not value:
+                raise ValidationError(required_message)
+            prepared[field] = value
+
+        price = data.get('price')
+        if price is None:
+            raise ValidationError("Price is required")
+
+        prepared['price'] = price
+        prepared['description'] = ProductService._clean_description(data.get('description'))
+        prepared['stock_quantity'] = int(data.get('stock_quantity', 0))
+        prepared['images'] = data.get('images')
+        return prepared
+
+    @staticmethod
+    def _clean_description(description: Optional[str]) -> Optional[str]:
+        """Strip a description; one that is only whitespace becomes None"""
+        if description:
+            return description.strip() or None
+        return description
 
     @staticmethod
     def get_product(product_id: str) -> Optional[Dict[str, Any]]:
@@ -88,27 +118,13 @@ class ProductService:
             NotFoundError: If brand_id or category_id don't exist
         """
         # Prepare updates dict
-        updates = {}
-
-        if 'name' in data:
-            updates['name'] = data['name'].strip()
-
-        if 'brand_id' in data:
-            updates['brand_id'] = data['brand_id'].strip()
-
-        if 'category_id' in data:
-            updates['category_id'] = data['category_id'].strip()
+        updates = {field: data[field].strip() for field, _ in _TEXT_FIELDS if field in data}
 
         if 'price' in data:
             updates['price'] = data['price']
 
         if 'description' in data:
-            description = data['description']
-            if description:
-                description = description.strip()
-                if not description:
-                    description = None
-            updates['description'] = description
+            updates['description'] = ProductService._clean_description(data['description'])
 
         if 'stock_quantity' in data:
             updates['stock_quantity'] = int(data['stock_quantity'])
@@ -193,8 +209,7 @@ class ProductService:
         Raises:
             ValidationError: If validation fails
         """
-        updates = {'stock_quantity': stock_quantity}
-        return Product.update(product_id, **updates)
+        return Product.set_stock(product_id, stock_quantity)
 
     @staticmethod
     def adjust_stock(product_id: str, quantity_change: int) -> Optional[Dict[str, Any]]:
@@ -212,15 +227,4 @@ class ProductService:
             ValidationError: If validation fails
             NotFoundError: If product doesn't exist
         """
-        # Get current product
-        product = Product.get(product_id)
-        if not product:
-            raise NotFoundError(f"Product with ID '{product_id}' not found")
-
-        current_stock = int(product.get('stock_quantity', 0))
-        new_stock = current_stock + quantity_change
-
-        if new_stock < 0:
-            raise ValidationError("Stock quantity cannot be negative after adjustment")
-
-        return ProductService.update_stock(product_id, new_stock)
+        return Product.adjust_stock(product_id, quantity_change)
@@ -1,49 +1,224 @@
-import boto3
-import json
+import random
+import time
 from decimal import Decimal
-from boto3.dynamodb.conditions import Key, Attr
+from functools import lru_cache
+
+import botocore.session
+from botocore.config import Config
 from botocore.exceptions import ClientError
+
 from config.settings import (
     TABLE_NAME, PK_FIELD, SK_FIELD,
-    GSI1_NAME, GSI1_PK, GSI1_SK,
-    GSI2_NAME, GSI2_PK, GSI2_SK,
+    GSI1_NAME, GSI1_PK,
+    GSI2_NAME, GSI2_PK,
     GSI3_NAME, GSI3_PK, GSI3_SK,
-    AWS_REGION
+    AWS_REGION, DYNAMODB_ENDPOINT, RUNNING_IN_LAMBDA,
+    DYNAMODB_CONNECT_TIMEOUT, DYNAMODB_READ_TIMEOUT, DYNAMODB_MAX_ATTEMPTS
+)
+from utils.exceptions import NotFoundError, DuplicateError, DatabaseError, ValidationError
+
+# botocore is used directly: importing boto3 also pulls in s3transfer, which
+# the Lambda cold start pays for without ever using it
+_session = botocore.session.get_session()
+
+# Operations the handlers call; their models are loaded during warm-up
+_WARM_OPERATIONS = ('GetItem', 'PutItem', 'UpdateItem', 'DeleteItem', 'Query', 'TransactWriteItems')
+
+# Constant expression fragments, built once instead of on every request
+_PK_EQ_CONDITION = '#pk = :pk'
+_PK_BEGINS_WITH_CONDITION = 'begins_with(#pk, :pk)'
+_PK_EQ_SK_BEGINS_WITH_CONDITION = '#pk = :pk AND begins_with(#sk, :sk)'
+_PK_EQ_SK_EQ_CONDITION = '#pk = :pk AND #sk = :sk'
+_GSI1_KEY_NAMES = {'#pk': GSI1_PK}
+_GSI2_KEY_NAMES = {'#pk': GSI2_PK}
+_GSI3_KEY_NAMES = {'#pk': GSI3_PK}
+_GSI3_KEY_NAMES_WITH_SK = {'#pk': GSI3_PK, '#sk': GSI3_SK}
+
+_INCREMENT_EXPRESSION = 'ADD #attr :amount'
+_EXISTS_CONDITION = 'attribute_exists(#pk)'
+_FLOOR_CONDITION = ' AND #attr >= :floor'
+_CEILING_CONDITION = ' AND (attribute_not_exists(#attr) OR #attr <= :ceiling)'
+_CHANGED_CONDITION = '(attribute_not_exists({name}) OR {name} <> {value})'
+
+# Per-request limits of BatchGetItem/BatchWriteItem, and how unprocessed
+# keys/items are retried (jittered exponential backoff from the delay, in seconds)
+_BATCH_GET_LIMIT = 100
+_BATCH_WRITE_LIMIT = 25
+_BATCH_MAX_ATTEMPTS = 5
+_BATCH_RETRY_DELAY = 0.05
+
+# Keep connections alive between warm invocations and give up on a stalled
+# endpoint well before botocore's 60s defaults (limits come from settings).
+# Standard retries: adaptive mode's client-side rate limiter can hold a
+# request back, which a latency-bound Lambda can't afford
+_client_config = Config(
+    retries={'total_max_attempts': DYNAMODB_MAX_ATTEMPTS, 'mode': 'standard'},
+    max_pool_connections=4,
+    tcp_keepalive=True,
+    connect_timeout=DYNAMODB_CONNECT_TIMEOUT,
+    read_timeout=DYNAMODB_READ_TIMEOUT
 )
-from utils.exceptions import NotFoundError, DuplicateError, DatabaseError
+
+
+def _serialize_value(value):
+    """Convert a Python value to a DynamoDB attribute value"""
+    if value is None:
+        return {'NULL': True}
+    if isinstance(value, bool):
+        return {'BOOL': value}
+    if isinstance(value, str):
+        return {'S': value}
+    if isinstance(value, (int, Decimal)):
+        return {'N': str(value)}
+    if isinstance(value, float):
+        # repr-shortest form, the same digits Decimal(str(value)) would carry
+        return {'N': str(value)}
+    if isinstance(value, (bytes, bytearray)):
+        return {'B': bytes(value)}
+    if isinstance(value, dict):
+        return {'M': {k: _serialize_value(v) for k, v in value.items()}}
+    if isinstance(value, (list, tuple)):
+        return {'L': [_serialize_value(v) for v in value]}
+    if isinstance(value, (set, frozenset)):
+        if all(isinstance(v, str) for v in value):
+            return {'SS': list(value)}
+        if all(isinstance(v, (int, Decimal)) and not isinstance(v, bool) for v in value):
+            return {'NS': [str(v) for v in value]}
+    raise TypeError(f"Unsupported type {type(value)} for value {value!r}")
+
+
+def _json_number(value):
+    """Parse a DynamoDB number string as int when whole, float otherwise"""
+    try:
+        return int(value)
+    except ValueError:
+        number = Decimal(value)
+        return int(number) if number % 1 == 0 else float(number)
+
+
+def _deserialize_value(attribute, parse_number=Decimal):
+    """Convert a DynamoDB attribute value to a Python value"""
+    (dynamodb_type, value), = attribute.items()
+    if dynamodb_type == 'S':
+        return value
+    if dynamodb_type == 'N':
+        return parse_number(value)
+    if dynamodb_type == 'NULL':
+        return None
+    if dynamodb_type == 'BOOL':
+        return value
+    if dynamodb_type == 'M':
+        return {k: _deserialize_value(v, parse_number) for k, v in value.items()}
+    if dynamodb_type == 'L':
+        return [_deserialize_value(v, parse_number) for v in value]
+    if dynamodb_type == 'SS':
+        return set(value)
+    if dynamodb_type == 'NS':
+        return {parse_number(v) for v in value}
+    if dynamodb_type == 'B':
+        return value
+    if dynamodb_type == 'BS':
+        return set(value)
+    raise TypeError(f"Unsupported DynamoDB type {dynamodb_type}")
+
+
+def _retry_delay(attempt):
+    """
+    Full-jitter exponential backoff for unprocessed batch entries: a random
+    sleep up to the doubled delay, so concurrent containers throttled
+    together don't all retry in lockstep
+    """
+    return random.uniform(0, _BATCH_RETRY_DELAY * 2 ** attempt)
+
+
+@lru_cache(maxsize=64)
+def _update_template(fields):
+    """
+    Build the parts of a SET update for a tuple of attribute names, in order:
+    (UpdateExpression, ExpressionAttributeNames, value placeholders). Updates
+    come from a few fixed field sets, so each template is built once per container.
+    """
+    names = {f"#attr{i}": field for i, field in enumerate(fields)}
+    value_names = tuple(f":val{i}" for i in range(len(fields)))
+    expression = "SET " + ", ".join(f"{name} = {value}" for name, value in zip(names, value_names))
+    return expression, names, value_names
+
+
+@lru_cache(maxsize=64)
+def _changed_update_template(fields, compare_fields):
+    """
+    _update_template plus the ConditionExpression of update_item_if_changed:
+    the item exists and at least one of `compare_fields` differs
+    """
+    expression, names, value_names = _update_template(fields)
+    changed_conditions = [
+        _CHANGED_CONDITION.format(name=name, value=value)
+        for (name, field), value in zip(names.items(), value_names)
+        if field in compare_fields
+    ]
+
+    # DynamoDB rejects redundant parentheses, so only group two or more terms
+    condition_expression = _EXISTS_CONDITION
+    if len(changed_conditions) == 1:
+        condition_expression += f" AND {changed_conditions[0]}"
+    elif changed_conditions:
+        condition_expression += f" AND ({' OR '.join(changed_conditions)})"
+
+    return expression, condition_expression, {**names, '#pk': PK_FIELD}, value_names
+
+
+@lru_cache(maxsize=None)
+def _projection(attributes):
+    """
+    Build a (ProjectionExpression, ExpressionAttributeNames) pair for a tuple of
+    attribute names; placeholders keep reserved words such as 'name' legal
+    """
+    names = {f"#p{i}": attribute for i, attribute in enumerate(attributes)}
+    return ', '.join(names), names
 
 
 class DynamoDbClient:
     def __init__(self):
-        # Support for local development with DynamoDB Local
-        import os
-        endpoint_url = os.getenv('DYNAMODB_ENDPOINT')
-
-        if endpoint_url:
-            # Local development
-            self.dynamodb = boto3.resource(
-                'dynamodb',
-                region_name=AWS_REGION,
-                endpoint_url=endpoint_url,
-            )
-        else:
-            # Production
-            self.dynamodb = boto3.resource('dynamodb', region_name=AWS_REGION)
+        # Low-level client only; the boto3 resource layer adds import and model-load
+        # cost at cold start. Items are (de)serialized with _serialize_value/_deserialize_value.
+        # DYNAMODB_ENDPOINT points at DynamoDB Local in development; unset (None)
+        # it resolves to the regional AWS endpoint. Built once per container
+        # through the singleton below, so warm invocations reuse its pool.
+        self.client = _session.create_client(
+            'dynamodb',
+            region_name=AWS_REGION,
+            endpoint_url=DYNAMODB_ENDPOINT,
+            config=_client_config,
+        )
 
-        self.table = self.dynamodb.Table(TABLE_NAME)
+    def warm_up(self):
+        """
+        Open a pooled connection with a cheap projected GetItem so the TLS
+        handshake and request signing happen during Lambda init, not on the
+        first billed invocation. Failures are ignored; the first real request
+        will simply pay the cost instead.
+        """
+        # botocore loads operation models lazily; load the write and query
+        # paths too, without sending anything that would touch the table
+        service_model = self.client.meta.service_model
+        for operation in _WARM_OPERATIONS:
+            service_model.operation_model(operation)
+
+        try:
+            self.check_item_exists('WARMUP', 'WARMUP')
+        except Exception:
+            pass
 
     def get_item(self, pk, sk):
         """Get a single item by partition key and sort key"""
         try:
-            response = self.table.get_item(
-                Key={
-                    PK_FIELD: pk,
-                    SK_FIELD: sk
-                }
+            response = self.client.get_item(
+                TableName=TABLE_NAME,
+                Key=self._key(pk, sk)
             )
             item = response.get('Item')
             if item:
-                return self._convert_decimal_to_float(item)
+                return self._to_jsonable(item)
             return None
         except ClientError as e:
             raise DatabaseError(f"Failed to get item: {str(e)}")
@@ -51,54 +226,40 @@ class DynamoDbClient:
     def put_item(self, item, condition_expression=None):
         """Create or update an item"""
         try:
-            # Convert any float values to Decimal for DynamoDB
-            item = self._convert_floats_to_decimal(item)
-
-            kwargs = {'Item': item}
+            # Floats are converted to Decimal during serialization
+            kwargs = {'TableName': TABLE_NAME, 'Item': self._serialize_item(item)}
             if condition_expression:
                 kwargs['ConditionExpression'] = condition_expression
 
-            response = self.table.put_item(**kwargs)
+            response = self.client.put_item(**kwargs)
             return response
         except ClientError as e:
             if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
                 raise DuplicateError("Item already exists or condition not met")
             raise DatabaseError(f"Failed to put item: {str(e)}")
 
-    def update_item(self, pk, sk, updates, condition_expression=None):
-        """Update an existing item"""
+    def update_item(self, pk, sk, updates, condition_expression=None, return_values='ALL_NEW'):
+        """Update an existing item; pass return_values='NONE' to skip reading it back"""
         try:
-            # Build update expression
-            update_expression = "SET "
-            expression_attribute_names = {}
-            expression_attribute_values = {}
-
-            for i, (key, value) in enumerate(updates.items()):
-                if i > 0:
-                    update_expression += ", "
-
-                attr_name = f"#attr{i}"
-                attr_value = f":val{i}"
-
-                update_expression += f"{attr_name} = {attr_value}"
-                expression_attribute_names[attr_name] = key
-                expression_attribute_values[attr_value] = self._convert_floats_to_decimal(value)
+            update_expression, expression_attribute_names, value_names = _update_template(tuple(updates))
+            expression_attribute_values = dict(zip(value_names, map(_serialize_value, updates.values())))
 
             kwargs = {
-                'Key': {PK_FIELD: pk, SK_FIELD: sk},
+                'TableName': TABLE_NAME,
+                'Key': self._key(pk, sk),
                 'UpdateExpression': update_expression,
                 'ExpressionAttributeNames': expression_attribute_names,
                 'ExpressionAttributeValues': expression_attribute_values,
-                'ReturnValues': 'ALL_NEW'
+                'ReturnValues': return_values
             }
 
             if condition_expression:
                 kwargs['ConditionExpression'] = condition_expression
 
-            response = self.table.update_item(**kwargs)
+            response = self.client.update_item(**kwargs)
             updated_item = response.get('Attributes')
             if updated_item:
-                return self._convert_decimal_to_float(updated_item)
+                return self._to_jsonable(updated_item)
             return None
 
         except ClientError as e:
@@ -106,21 +267,106 @@ class DynamoDbClient:
                 raise NotFoundError("Item not found or condition not met")
             raise DatabaseError(f"Failed to update item: {str(e)}")
 
-    def delete_item(self, pk, sk, condition_expression=None):
-        """Delete an item"""
+    def update_item_if_changed(self, pk, sk, updates, compare_fields):
+        """
+        Update an existing item only if one of `compare_fields` would change.
+        Equality is decided by the write's condition, so there is no prior
+        GetItem; a no-op leaves the item (and any timestamp in `updates`) as is.
+
+        Returns:
+            (item, changed): the updated item, or the stored one when nothing changed
+
+        Raises:
+            NotFoundError: If the item doesn't exist
+        """
+        try:
+            update_expression, condition_expression, expression_attribute_names, value_names = (
+                _changed_update_template(tuple(updates), compare_fields)
+            )
+            expression_attribute_values = dict(zip(value_names, map(_serialize_value, updates.values())))
+
+            response = self.client.update_item(
+                TableName=TABLE_NAME,
+                Key=self._key(pk, sk),
+                UpdateExpression=update_expression,
+                ConditionExpression=condition_expression,
+                ExpressionAttributeNames=expression_attribute_names,
+                ExpressionAttributeValues=expression_attribute_values,
+                ReturnValues='ALL_NEW',
+                ReturnValuesOnConditionCheckFailure='ALL_OLD'
+            )
+            return self._to_jsonable(response['Attributes']), True
+
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                if 'Item' in e.response:
+                    return self._to_jsonable(e.response['Item']), False
+                raise NotFoundError("Item not found")
+            raise DatabaseError(f"Failed to update item: {str(e)}")
+
+    def increment_attribute(self, pk, sk, attribute, amount, min_value=None, max_value=None, updates=None):
+        """
+        Atomically add `amount` to a numeric attribute using a single UpdateItem ADD.
+        Bounds are enforced server-side with a condition, so concurrent adjustments
+        can't lose updates or push the value out of range.
+        """
+        try:
+            set_clauses = []
+            expression_attribute_names = {'#pk': PK_FIELD, '#attr': attribute}
+            expression_attribute_values = {':amount': {'N': str(amount)}}
+
+            for i, (key, value) in enumerate((updates or {}).items()):
+                set_clauses.append(f"#set{i} = :set{i}")
+                expression_attribute_names[f"#set{i}"] = key
+                expression_attribute_values[f":set{i}"] = _serialize_value(value)
+
+            update_expression = _INCREMENT_EXPRESSION
+            if set_clauses:
+                update_expression = f"SET {', '.join(set_clauses)} {update_expression}"
+
+            condition_expression = _EXISTS_CONDITION
+            if min_value is not None and amount < 0:
+                condition_expression += _FLOOR_CONDITION
+                expression_attribute_values[':floor'] = {'N': str(min_value - amount)}
+            if max_value is not None and amount > 0:
+                condition_expression += _CEILING_CONDITION
+                expression_attribute_values[':ceiling'] = {'N': str(max_value - amount)}
+
+            response = self.client.update_item(
+                TableName=TABLE_NAME,
+                Key=self._key(pk, sk),
+                UpdateExpression=update_expression,
+                ConditionExpression=condition_expression,
+                ExpressionAttributeNames=expression_attribute_names,
+                ExpressionAttributeValues=expression_attribute_values,
+                ReturnValues='ALL_NEW',
+                ReturnValuesOnConditionCheckFailure='ALL_OLD'
+            )
+            return self._to_jsonable(response['Attributes'])
+
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                if 'Item' in e.response:
+                    raise ValidationError(f"{attribute} would fall outside the allowed range")
+                raise NotFoundError("Item not found")
+            raise DatabaseError(f"Failed to increment attribute: {str(e)}")
+
+    def delete_item(self, pk, sk, condition_expression=None, return_values='ALL_OLD'):
+        """Delete an item; pass return_values='NONE' to skip reading the old item back"""
         try:
             kwargs = {
-                'Key': {PK_FIELD: pk, SK_FIELD: sk},
-                'ReturnValues': 'ALL_OLD'
+                'TableName': TABLE_NAME,
+                'Key': self._key(pk, sk),
+                'ReturnValues': return_values
             }
 
             if condition_expression:
                 kwargs['ConditionExpression'] = condition_expression
 
-            response = self.table.delete_item(**kwargs)
+            response = self.client.delete_item(**kwargs)
             deleted_item = response.get('Attributes')
             if deleted_item:
-                return self._convert_decimal_to_float(deleted_item)
+                return self._to_jsonable(deleted_item)
             return None
 
         except ClientError as e:
@@ -130,91 +376,101 @@ class DynamoDbClient:
 
     # Query Methods for the GSI structure
 
-    def list_entities_by_type(self, entity_type, limit=50, last_evaluated_key=None):
+    def list_entities_by_type(self, entity_type, limit=50, last_evaluated_key=None, attributes=None):
         """
         List all entities of a specific type using GSI-1 (inverted index)
         Query where SK begins_with entity_type
+        Pass a tuple of attribute names as `attributes` to return only those.
         """
         try:
-            key_condition = Key(GSI1_PK).begins_with(f"{entity_type}#")
-
             kwargs = {
                 'IndexName': GSI1_NAME,
-                'KeyConditionExpression': key_condition,
+                'KeyConditionExpression': _PK_BEGINS_WITH_CONDITION,
+                'ExpressionAttributeNames': _GSI1_KEY_NAMES,
+                'ExpressionAttributeValues': {':pk': {'S': f"{entity_type}#"}},
                 'Limit': limit
             }
 
-            if last_evaluated_key:
-                kwargs['ExclusiveStartKey'] = last_evaluated_key
-
-            response = self.table.query(**kwargs)
-            return {
-                'items': [self._convert_decimal_to_float(item) for item in response.get('Items', [])],
-                'last_evaluated_key': response.get('LastEvaluatedKey')
-            }
+            return self._query(kwargs, last_evaluated_key, attributes)
 
         except ClientError as e:
             raise DatabaseError(f"Failed to list entities: {str(e)}")
 
-    def get_products_by_brand(self, brand_id, limit=50, last_evaluated_key=None):
+    def get_products_by_brand(self, brand_id, limit=50, last_evaluated_key=None, attributes=None):
         """
         Get products by brand using GSI-2
         Query where brand_id = brand_id
         """
         try:
-            key_condition = Key(GSI2_PK).eq(brand_id)
-
             kwargs = {
                 'IndexName': GSI2_NAME,
-                'KeyConditionExpression': key_condition,
+                'KeyConditionExpression': _PK_EQ_CONDITION,
+                'ExpressionAttributeNames': _GSI2_KEY_NAMES,
+                'ExpressionAttributeValues': {':pk': {'S': brand_id}},
                 'Limit': limit
             }
 
-            if last_evaluated_key:
-                kwargs['ExclusiveStartKey'] = last_evaluated_key
-
-            response = self.table.query(**kwargs)
-            return {
-                'items': [self._convert_decimal_to_float(item) for item in response.get('Items', [])],
-                'last_evaluated_key': response.get('LastEvaluatedKey')
-            }
+            return self._query(kwargs, last_evaluated_key, attributes)
 
         except ClientError as e:
             raise DatabaseError(f"Failed to get products by brand: {str(e)}")
 
-    def query_gsi3(self, gsi3_pk, gsi3_sk_begins_with=None, limit=50, last_evaluated_key=None):
+    def query_gsi3(self, gsi3_pk, gsi3_sk_begins_with=None, limit=50, last_evaluated_key=None,
+                   attributes=None):
         """
         Flexible query using GSI-3
         Can be used for:
         - List brands by name: GSI3PK="BRAND_LIST"
         - List categories by name: GSI3PK="CATEGORY_LIST"
         - Get products by category: GSI3PK="CATEGORY#{id}"
+        Pass a tuple of attribute names as `attributes` to return only those.
         """
         try:
-            key_condition = Key(GSI3_PK).eq(gsi3_pk)
+            kwargs = {
+                'IndexName': GSI3_NAME,
+                'KeyConditionExpression': _PK_EQ_CONDITION,
+                'ExpressionAttributeNames': _GSI3_KEY_NAMES,
+                'ExpressionAttributeValues': {':pk': {'S': gsi3_pk}},
+                'Limit': limit
+            }
 
             if gsi3_sk_begins_with:
-                key_condition = key_condition & Key(GSI3_SK).begins_with(gsi3_sk_begins_with)
+                kwargs['KeyConditionExpression'] = _PK_EQ_SK_BEGINS_WITH_CONDITION
+                kwargs['ExpressionAttributeNames'] = _GSI3_KEY_NAMES_WITH_SK
+                kwargs['ExpressionAttributeValues'][':sk'] = {'S': gsi3_sk_begins_with}
+
+            return self._query(kwargs, last_evaluated_key, attributes)
+
+        except ClientError as e:
+            raise DatabaseError(f"Failed to query GSI3: {str(e)}")
 
+    def query_gsi3_eq(self, gsi3_pk, gsi3_sk, limit=2, projection=None):
+        """
+        Exact-match lookup on GSI-3 (GSI3PK = gsi3_pk AND GSI3SK = gsi3_sk),
+        e.g. finding a brand by its uppercased name without listing all brands.
+        Pass a ProjectionExpression as `projection` to return only those attributes.
+        """
+        try:
             kwargs = {
                 'IndexName': GSI3_NAME,
-                'KeyConditionExpression': key_condition,
+                'KeyConditionExpression': _PK_EQ_SK_EQ_CONDITION,
+                'ExpressionAttributeNames': _GSI3_KEY_NAMES_WITH_SK,
+                'ExpressionAttributeValues': {
+                    ':pk': {'S': gsi3_pk},
+                    ':sk': {'S': gsi3_sk}
+                },
                 'Limit': limit
             }
 
-            if last_evaluated_key:
-                kwargs['ExclusiveStartKey'] = last_evaluated_key
+            if projection:
+                kwargs['ProjectionExpression'] = projection
 
-            response = self.table.query(**kwargs)
-            return {
-                'items': [self._convert_decimal_to_float(item) for item in response.get('Items', [])],
-                'last_evaluated_key': response.get('LastEvaluatedKey')
-            }
+            return self._query(kwargs)['items']
 
         except ClientError as e:
             raise DatabaseError(f"Failed to query GSI3: {str(e)}")
 
-    def get_products_by_category(self, category_id, limit=50, last_evaluated_key=None):
+    def get_products_by_category(self, category_id, limit=50, last_evaluated_key=None, attributes=None):
         """
         Get products by category using GSI-3
         Query where GSI3PK = "CATEGORY#{category_id}"
@@ -222,7 +478,8 @@ class DynamoDbClient:
         return self.query_gsi3(
             gsi3_pk=f"CATEGORY#{category_id}",
             limit=limit,
-            last_evaluated_key=last_evaluated_key
+            last_evaluated_key=last_evaluated_key,
+            attributes=attributes
         )
 
     def list_brands_by_name(self, limit=50, last_evaluated_key=None):
@@ -247,7 +504,7 @@ class DynamoDbClient:
             last_evaluated_key=last_evaluated_key
         )
 
-    def list_products_by_name(self, limit=50, last_evaluated_key=None):
+    def list_products_by_name(self, limit=50, last_evaluated_key=None, attributes=None):
         """
         List products sorted by name using GSI-3
         Query where GSI3PK = "PRODUCT_LIST"
@@ -255,93 +512,193 @@ class DynamoDbClient:
         return self.query_gsi3(
             gsi3_pk="PRODUCT_LIST",
             limit=limit,
-            last_evaluated_key=last_evaluated_key
+            last_evaluated_key=last_evaluated_key,
+            attributes=attributes
         )
 
-    def batch_get_items(self, keys):
-        """Get multiple items in a single request"""
-        try:
-            # DynamoDB batch_get_item expects keys in a specific format
-            request_items = {
-                TABLE_NAME: {
-                    'Keys': [
-                        {PK_FIELD: key['pk'], SK_FIELD: key['sk']}
-                        for key in keys
-                    ]
-                }
+    def batch_get_items(self, keys, projection=None):
+        """
+        Get multiple items, 100 keys per BatchGetItem request; keys DynamoDB
+        leaves unprocessed are retried. Pass a ProjectionExpression as
+        `projection` to return only those attributes.
+        """
+        requests = []
+        for start in range(0, len(keys), _BATCH_GET_LIMIT):
+            table_request = {
+                'Keys': [self._key(key['pk'], key['sk'])
+                         for key in keys[start:start + _BATCH_GET_LIMIT]]
             }
+            if projection:
+                table_request['ProjectionExpression'] = projection
+            requests.append(table_request)
 
-            response = self.dynamodb.batch_get_item(RequestItems=request_items)
-            items = response.get('Responses', {}).get(TABLE_NAME, [])
-            return [self._convert_decimal_to_float(item) for item in items]
+        try:
+            return [
+                self._to_jsonable(item)
+                for request in requests
+                for item in self._batch_get_chunk(request)
+            ]
 
         except ClientError as e:
             raise DatabaseError(f"Failed to batch get items: {str(e)}")
 
+    def _batch_get_chunk(self, table_request):
+        """Run one BatchGetItem request, retrying unprocessed keys; returns raw items"""
+        items = []
+        request_items = {TABLE_NAME: table_request}
+        for attempt in range(_BATCH_MAX_ATTEMPTS):
+            response = self.client.batch_get_item(RequestItems=request_items)
+            items.extend(response.get('Responses', {}).get(TABLE_NAME, []))
+            request_items = response.get('UnprocessedKeys')
+            if not request_items:
+                return items
+            time.sleep(_retry_delay(attempt))
+        raise DatabaseError("Failed to batch get items: keys left unprocessed")
+
     def batch_write_items(self, items_to_put=None, items_to_delete=None):
-        """Batch write (put/delete) multiple items"""
+        """
+        Batch write (put/delete) multiple items, 25 per BatchWriteItem request;
+        requests DynamoDB leaves unprocessed are retried. Not atomic: a failure
+        part-way leaves the earlier chunks written.
+        """
         try:
-            request_items = {TABLE_NAME: []}
+            write_requests = []
 
             if items_to_put:
                 for item in items_to_put:
-                    request_items[TABLE_NAME].append({
+                    write_requests.append({
                         'PutRequest': {
-                            'Item': self._convert_floats_to_decimal(item)
+                            'Item': self._serialize_item(item)
                         }
                     })
 
             if items_to_delete:
                 for key in items_to_delete:
-                    request_items[TABLE_NAME].append({
+                    write_requests.append({
                         'DeleteRequest': {
-                            'Key': {PK_FIELD: key['pk'], SK_FIELD: key['sk']}
+                            'Key': self._key(key['pk'], key['sk'])
                         }
                     })
 
-            response = self.dynamodb.batch_write_item(RequestItems=request_items)
-            return response
+            for start in range(0, len(write_requests), _BATCH_WRITE_LIMIT):
+                request_items = {TABLE_NAME: write_requests[start:start + _BATCH_WRITE_LIMIT]}
+                for attempt in range(_BATCH_MAX_ATTEMPTS):
+                    response = self.client.batch_write_item(RequestItems=request_items)
+                    request_items = response.get('UnprocessedItems')
+                    if not request_items:
+                        break
+                    time.sleep(_retry_delay(attempt))
+                else:
+                    raise DatabaseError("Failed to batch write items: items left unprocessed")
 
         except ClientError as e:
             raise DatabaseError(f"Failed to batch write items: {str(e)}")
 
+    def transact_write_items(self, items_to_put=None, items_to_delete=None):
+        """
+        Put and delete items in one all-or-nothing TransactWriteItems call.
+        Delete keys are {'pk': ..., 'sk': ...}, optionally with a
+        'condition_expression'; a failed condition cancels the whole transaction.
+        """
+        try:
+            transact_items = []
+
+            for item in items_to_put or ():
+                transact_items.append({
+                    'Put': {
+                        'TableName': TABLE_NAME,
+                        'Item': self._serialize_item(item)
+                    }
+                })
+
+            for key in items_to_delete or ():
+                delete = {
+                    'TableName': TABLE_NAME,
+                    'Key': self._key(key['pk'], key['sk'])
+                }
+                if key.get('condition_expression'):
+                    delete['ConditionExpression'] = key['condition_expression']
+                transact_items.append({'Delete': delete})
+
+            return self.client.transact_write_items(TransactItems=transact_items)
+
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'TransactionCanceledException':
+                reasons = e.response.get('CancellationReasons') or []
+                if any(reason.get('Code') == 'ConditionalCheckFailed' for reason in reasons):
+                    raise NotFoundError("Item not found or condition not met")
+            raise DatabaseError(f"Failed to write transaction: {str(e)}")
+
     def check_item_exists(self, pk, sk):
         """Check if an item exists without returning the full item"""
         try:
-            response = self.table.get_item(
-                Key={PK_FIELD: pk, SK_FIELD: sk},
+            response = self.client.get_item(
+                TableName=TABLE_NAME,
+                Key=self._key(pk, sk),
                 ProjectionExpression=PK_FIELD  # Only return PK to minimize data transfer
             )
             return 'Item' in response
         except ClientError as e:
             raise DatabaseError(f"Failed to check item existence: {str(e)}")
 
-    def _convert_floats_to_decimal(self, obj):
-        """Convert float values to Decimal for DynamoDB compatibility"""
-        if isinstance(obj, dict):
-            return {k: self._convert_floats_to_decimal(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._convert_floats_to_decimal(item) for item in obj]
-        elif isinstance(obj, float):
-            return Decimal(str(obj))
-        else:
-            return obj
-
-    def _convert_decimal_to_float(self, obj):
-        """Convert Decimal values back to float for JSON serialization, preserving integers"""
-        if isinstance(obj, dict):
-            return {k: self._convert_decimal_to_float(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._convert_decimal_to_float(item) for item in obj]
-        elif isinstance(obj, Decimal):
-            # Check if the Decimal represents a whole number
-            if obj % 1 == 0:
-                return int(obj)
-            else:
-                return float(obj)
-        else:
-            return obj
-
-
-# Singleton instance
+    def _query(self, kwargs, last_evaluated_key=None, attributes=None):
+        """Run a query against the table and deserialize items and pagination key"""
+        kwargs['TableName'] = TABLE_NAME
+
+        if attributes:
+            projection, projection_names = _projection(attributes)
+            kwargs['ProjectionExpression'] = projection
+            # Merge into a copy; the key-name dicts are shared module constants
+            kwargs['ExpressionAttributeNames'] = {**kwargs['ExpressionAttributeNames'], **projection_names}
+
+        if last_evaluated_key:
+            kwargs['ExclusiveStartKey'] = self._serialize_item(last_evaluated_key)
+
+        response = self.client.query(**kwargs)
+        next_key = response.get('LastEvaluatedKey')
+        return {
+            'items': [
+                self._to_jsonable(item)
+                for item in response.get('Items', [])
+            ],
+            'last_evaluated_key': self._deserialize_item(next_key) if next_key else None
+        }
+
+    @staticmethod
+    def _key(pk, sk):
+        """Build a low-level primary key"""
+        return {PK_FIELD: {'S': pk}, SK_FIELD: {'S': sk}}
+
+    def _serialize_item(self, item):
+        """Convert a Python dict to DynamoDB attribute values"""
+        return {k: _serialize_value(v) for k, v in item.items()}
+
+    @staticmethod
+    def _deserialize_item(item):
+        """Convert DynamoDB attribute values to a Python dict"""
+        return {k: _deserialize_value(v) for k, v in item.items()}
+
+    @staticmethod
+    def _to_jsonable(item):
+        """
+        Convert DynamoDB attribute values straight to a JSON-ready dict, with
+        numbers as int or float; one pass, no intermediate Decimal objects
+        """
+        return {k: _deserialize_value(v, _json_number) for k, v in item.items()}
+
+
+# Singleton instance. Import it rather than constructing DynamoDbClient in
+# handler or model code: a per-request client repeats endpoint resolution,
+# credential loading and the TLS handshake that warm invocations otherwise skip.
 db_client = DynamoDbClient()
+
+if RUNNING_IN_LAMBDA:
+    db_client.warm_up()
+
+    # With SnapStart the pooled connection in the snapshot is stale after a
+    # restore, so reopen it before the first invocation
+    try:
+        from snapshot_restore_py import register_after_restore
+        register_after_restore(db_client.warm_up)
+    except ImportError:
+        pass
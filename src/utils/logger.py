@@ -1,13 +1,49 @@
 import logging
 import json
 import os
+from functools import lru_cache
 from typing import Any, Dict
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a log payload, with orjson when it is available"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode()
+    return json.dumps(obj, default=str)
+
+
+class _JsonFormatter(logging.Formatter):
+    """Format each record as one JSON line that CloudWatch Logs Insights indexes as fields"""
+
+    # `extra=` keys copied into the line as nested objects
+    STRUCTURED_FIELDS = ('request',)
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            'timestamp': self.formatTime(record),
+            'logger': record.name,
+            'level': record.levelname,
+            'message': record.getMessage()
+        }
+        for field in self.STRUCTURED_FIELDS:
+            if field in record.__dict__:
+                payload[field] = record.__dict__[field]
+        if record.exc_info:
+            payload['exception'] = self.formatException(record.exc_info)
+        return _dumps(payload)
+
+
+@lru_cache(maxsize=None)
 def setup_logger(name: str) -> logging.Logger:
-    """Set up structured logger for Lambda functions"""
+    """Set up structured logger for Lambda functions (configured once per name)"""
     logger = logging.getLogger(name)
 
-    # Avoid adding multiple handlers
+    # Avoid adding multiple handlers when the logger was configured elsewhere
     if logger.handlers:
         return logger
 
@@ -18,17 +54,18 @@ def setup_logger(name: str) -> logging.Logger:
     # Create handler
     handler = logging.StreamHandler()
 
-    # Create formatter for structured logging
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    handler.setFormatter(formatter)
+    # One JSON object per line for structured logging
+    handler.setFormatter(_JsonFormatter())
 
     logger.addHandler(handler)
     return logger
 
 def log_request_info(logger: logging.Logger, event: Dict[str, Any]) -> None:
     """Log structured request information"""
+    # Skip building and serializing the payload when INFO is suppressed
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     request_info = {
         'http_method': event.get('httpMethod'),
         'resource_path': event.get('resource'),
@@ -36,4 +73,5 @@ def log_request_info(logger: logging.Logger, event: Dict[str, Any]) -> None:
         'query_parameters': event.get('queryStringParameters'),
         'request_id': event.get('requestContext', {}).get('requestId')
     }
-    logger.info(f"Processing request: {json.dumps(request_info)}")
+    # Serialized once, by the formatter, as a nested field of the log line
+    logger.info("Processing request", extra={'request': request_info})
@@ -1,7 +1,15 @@
 import json
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 from decimal import Decimal
 
+from config.settings import CORS_HEADERS_STR
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder/decoder
+    orjson = None
+
 
 class DecimalEncoder(json.JSONEncoder):
     """JSON encoder that handles Decimal types"""
@@ -11,6 +19,77 @@ class DecimalEncoder(json.JSONEncoder):
         return super(DecimalEncoder, self).default(obj)
 
 
+# Built once and reused; compact separators keep response bodies small
+_json_encoder = DecimalEncoder(separators=(',', ':'))
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize types orjson doesn't handle natively"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Bodies are returned as str: orjson's bytes need one C-level UTF-8 decode,
+# whereas base64 with isBase64Encoded would add an encode pass and a third
+# more payload for API Gateway to decode again
+if orjson is not None:
+    def _encode_json(obj: Any) -> str:
+        """Encode a response body with orjson"""
+        return orjson.dumps(obj, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _decode_json = orjson.loads
+else:
+    _encode_json = _json_encoder.encode
+    _decode_json = json.loads
+
+class _ReadOnlyHeaders(dict):
+    """
+    A dict that rejects mutation. Unlike a mappingproxy it is still a dict, so
+    the Lambda runtime can JSON-encode it and one instance can be shared by
+    every response without a caller's change leaking into the next one
+    """
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Default response headers are read-only; pass headers to create_response")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+
+# Headers sent with every response; built once and shared by reference
+_DEFAULT_HEADERS: Mapping[str, str] = _ReadOnlyHeaders({
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+    'Access-Control-Allow-Headers': CORS_HEADERS_STR
+})
+
+# Pagination keys are small; anything longer is rejected before parsing
+MAX_LAST_KEY_LENGTH = 4096
+
+# Shared read-only stand-in for absent path/query parameters
+_NO_PARAMETERS: Mapping[str, Any] = MappingProxyType({})
+
+
+# Message-only bodies for the helpers' fixed default messages, encoded once at
+# import. Other messages are often interpolated with IDs, so they aren't kept
+_DEFAULT_MESSAGE_BODIES: Mapping[str, str] = MappingProxyType({
+    message: _encode_json({'message': message})
+    for message in (
+        "Success", "Created successfully", "Bad request", "Not found",
+        "Conflict", "Internal server error"
+    )
+})
+
+
+def _message_body(message: str) -> str:
+    """Encode a message-only body, reusing the pre-encoded default messages"""
+    body = _DEFAULT_MESSAGE_BODIES.get(message)
+    if body is None:
+        body = _encode_json({'message': message})
+    return body
+
+
 def create_response(
     status_code: int,
     body: Any = None,
@@ -29,16 +108,22 @@ def create_response(
     Returns:
         API Gateway response dict
     """
-    default_headers = {
-        'Content-Type': 'application/json',
-        'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
-        'Access-Control-Allow-Headers': 'Content-Type, Authorization, X-Amz-Date, X-Api-Key, X-Amz-Security-Token'
+    response_headers = {**_DEFAULT_HEADERS, **headers} if headers else _DEFAULT_HEADERS
+
+    if body is None and message:
+        encoded_body = _message_body(message)
+    else:
+        encoded_body = _encode_json(_build_body(body, message))
+
+    return {
+        'statusCode': status_code,
+        'headers': response_headers,
+        'body': encoded_body
     }
 
-    if headers:
-        default_headers.update(headers)
 
+def _build_body(body: Any, message: Optional[str]) -> Dict[str, Any]:
+    """Assemble the response body dict from data and an optional message"""
     response_body = {}
 
     if message:
@@ -50,11 +135,7 @@ def create_response(
         else:
             response_body.update(body if isinstance(body, dict) else {'data': body})
 
-    return {
-        'statusCode': status_code,
-        'headers': default_headers,
-        'body': json.dumps(response_body, cls=DecimalEncoder)
-    }
+    return response_body
 
 
 def success_response(data: Any = None, message: str = "Success") -> Dict[str, Any]:
@@ -106,7 +187,7 @@ def parse_json_body(event: Dict[str, Any]) -> Dict[str, Any]:
         return {}
 
     try:
-        return json.loads(body)
+        return _decode_json(body)
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON: {str(e)}")
 
@@ -123,5 +204,45 @@ def get_query_parameter(event: Dict[str, Any], param_name: str, default_value: A
     Returns:
         Parameter value or default
     """
-    query_params = event.get('queryStringParameters') or {}
+    query_params = event.get('queryStringParameters') or _NO_PARAMETERS
     return query_params.get(param_name, default_value)
+
+
+def get_path_parameters(event: Dict[str, Any]) -> Mapping[str, Any]:
+    """
+    Get path parameters from API Gateway event
+
+    Args:
+        event: API Gateway event
+
+    Returns:
+        Path parameters, or a shared empty read-only mapping if there are none
+    """
+    return event.get('pathParameters') or _NO_PARAMETERS
+
+
+def get_last_evaluated_key(event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Get the pagination key from the last_key query parameter
+
+    Args:
+        event: API Gateway event
+
+    Returns:
+        Decoded pagination key or None if not provided
+
+    Raises:
+        ValueError: If last_key is too large or not valid JSON
+    """
+    last_key = get_query_parameter(event, 'last_key')
+
+    if not last_key:
+        return None
+
+    if len(last_key) > MAX_LAST_KEY_LENGTH:
+        raise ValueError("last_key too large")
+
+    try:
+        return _decode_json(last_key)
+    except json.JSONDecodeError:
+        raise ValueError("Invalid last_key format")
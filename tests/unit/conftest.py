@@ -0,0 +1,58 @@
+import botocore.session
+import pytest
+from moto import mock_aws
+
+from config.settings import (
+    TABLE_NAME, PK_FIELD, SK_FIELD,
+    GSI1_NAME, GSI2_NAME, GSI2_PK, GSI2_SK,
+    GSI3_NAME, GSI3_PK, GSI3_SK
+)
+from models import product as product_model
+from utils.db_operations import db_client
+
+
+def _key_schema(hash_key, range_key):
+    return [
+        {'AttributeName': hash_key, 'KeyType': 'HASH'},
+        {'AttributeName': range_key, 'KeyType': 'RANGE'}
+    ]
+
+
+@pytest.fixture
+def dynamodb_table(monkeypatch):
+    """
+    Point the shared db_client at an in-memory moto table with the
+    production key schema and GSIs; yields the low-level client
+    """
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'testing')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'testing')
+
+    with mock_aws():
+        client = botocore.session.get_session().create_client('dynamodb', region_name='us-east-1')
+        client.create_table(
+            TableName=TABLE_NAME,
+            BillingMode='PAY_PER_REQUEST',
+            AttributeDefinitions=[
+                {'AttributeName': name, 'AttributeType': 'S'}
+                for name in (PK_FIELD, SK_FIELD, GSI2_PK, GSI2_SK, GSI3_PK, GSI3_SK)
+            ],
+            KeySchema=_key_schema(PK_FIELD, SK_FIELD),
+            GlobalSecondaryIndexes=[
+                {'IndexName': GSI1_NAME, 'KeySchema': _key_schema(SK_FIELD, PK_FIELD),
+                 'Projection': {'ProjectionType': 'ALL'}},
+                {'IndexName': GSI2_NAME, 'KeySchema': _key_schema(GSI2_PK, GSI2_SK),
+                 'Projection': {'ProjectionType': 'ALL'}},
+                {'IndexName': GSI3_NAME, 'KeySchema': _key_schema(GSI3_PK, GSI3_SK),
+                 'Projection': {'ProjectionType': 'ALL'}}
+            ]
+        )
+        monkeypatch.setattr(db_client, 'client', client)
+
+        # Existence caches live at module scope; don't let IDs leak between tests
+        product_model._brand_exists_cache.clear()
+        product_model._category_exists_cache.clear()
+
+        yield client
+
+        product_model._brand_exists_cache.clear()
+        product_model._category_exists_cache.clear()
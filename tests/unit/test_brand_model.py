@@ -0,0 +1,48 @@
+import pytest
+
+from models.brand import Brand
+from utils.exceptions import NotFoundError
+
+
+@pytest.fixture
+def brand(dynamodb_table):
+    """A stored brand"""
+    return Brand.create('Acme', 'Acme brand description', 'https://acme.example.com')
+
+
+class TestBrandUpdate:
+    """Test class for Brand.update"""
+
+    def test_update_returns_new_brand(self, brand):
+        """Test an update of an existing brand is written and returned"""
+        # Act
+        result = Brand.update(brand['brand_id'], name='Acme Tools')
+
+        # Assert
+        assert result['name'] == 'Acme Tools'
+        assert result['GSI3SK'] == 'ACME TOOLS'
+        assert Brand.get(brand['brand_id'])['name'] == 'Acme Tools'
+
+    def test_update_missing_brand_raises_not_found(self, dynamodb_table):
+        """Test updating a missing ID raises NotFoundError and creates no item"""
+        # Act / Assert
+        with pytest.raises(NotFoundError, match="Brand with ID 'missing' not found"):
+            Brand.update('missing', description='Some description')
+        assert Brand.get('missing') is None
+        assert Brand.list_all()['items'] == []
+
+
+class TestBrandDelete:
+    """Test class for Brand.delete"""
+
+    def test_delete_removes_brand(self, brand):
+        """Test deleting an existing brand reports success"""
+        # Act / Assert
+        assert Brand.delete(brand['brand_id']) is True
+        assert Brand.get(brand['brand_id']) is None
+
+    def test_delete_missing_brand_returns_false(self, dynamodb_table):
+        """Test deleting a missing ID returns False and leaves no item behind"""
+        # Act / Assert
+        assert Brand.delete('missing') is False
+        assert Brand.get('missing') is None
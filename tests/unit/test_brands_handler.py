@@ -117,6 +117,24 @@ class TestBrandsHandler:
         assert 'Invalid last_key format' in body['message']
         mock_brand_service.list_brands.assert_not_called()
 
+    @patch('handlers.brands.BrandService')
+    def test_get_brands_list_oversized_last_key(self, mock_brand_service):
+        """Test GET /brands rejects an oversized last_key without parsing it"""
+        # Arrange
+        event = self.create_api_gateway_event(
+            'GET',
+            query_string_parameters={'last_key': json.dumps({'PK': 'x' * 5000})}
+        )
+
+        # Act
+        response = lambda_handler(event, self.mock_context)
+
+        # Assert
+        assert response['statusCode'] == 400
+        body = json.loads(response['body'])
+        assert 'last_key too large' in body['message']
+        mock_brand_service.list_brands.assert_not_called()
+
     @patch('handlers.brands.BrandService')
     def test_get_brand_by_id_success(self, mock_brand_service):
         """Test successful GET /brands/{id} request"""
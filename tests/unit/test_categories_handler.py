@@ -583,6 +583,50 @@ class TestCategoriesHandler:
         assert 'already exists' in body['message']
         mock_category_service.update_category.assert_called_once_with(category_id, update_data)
 
+    @patch('handlers.categories.CategoryService')
+    def test_routes_on_method_and_id_presence(self, mock_category_service):
+        """Test each (method, has ID) pair reaches the matching service call"""
+        # Arrange
+        mock_category_service.list_categories.return_value = {'items': [], 'last_evaluated_key': None}
+        mock_category_service.get_category.return_value = {'category_id': 'cat-1'}
+        mock_category_service.update_category.return_value = {'category_id': 'cat-1'}
+        mock_category_service.delete_category.return_value = True
+        body = json.dumps({'name': 'Shoes'})
+
+        # Act
+        responses = [
+            lambda_handler(self.create_api_gateway_event('GET'), self.mock_context),
+            lambda_handler(self.create_api_gateway_event('GET', {'id': 'cat-1'}), self.mock_context),
+            lambda_handler(self.create_api_gateway_event('PUT', {'id': 'cat-1'}, body=body), self.mock_context),
+            lambda_handler(self.create_api_gateway_event('DELETE', {'id': 'cat-1'}), self.mock_context),
+            lambda_handler(self.create_api_gateway_event('PATCH', {'id': 'cat-1'}), self.mock_context)
+        ]
+
+        # Assert
+        assert [response['statusCode'] for response in responses] == [200, 200, 200, 200, 400]
+        mock_category_service.list_categories.assert_called_once()
+        mock_category_service.get_category.assert_called_once_with('cat-1')
+        mock_category_service.update_category.assert_called_once_with('cat-1', {'name': 'Shoes'})
+        mock_category_service.delete_category.assert_called_once_with('cat-1')
+        mock_category_service.create_category.assert_not_called()
+
+    @patch('handlers.categories.CategoryService')
+    def test_http_api_v2_event_is_routed(self, mock_category_service):
+        """Test the method is read from requestContext.http when httpMethod is absent"""
+        # Arrange
+        mock_category_service.get_category.return_value = {'category_id': 'cat-1'}
+        event = {
+            'pathParameters': {'id': 'cat-1'},
+            'requestContext': {'http': {'method': 'GET'}}
+        }
+
+        # Act
+        response = lambda_handler(event, self.mock_context)
+
+        # Assert
+        assert response['statusCode'] == 200
+        mock_category_service.get_category.assert_called_once_with('cat-1')
+
 
 # Integration-style tests (still unit tests but testing more end-to-end flow)
 class TestCategoriesHandlerIntegration:
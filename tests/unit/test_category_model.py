@@ -0,0 +1,57 @@
+import pytest
+
+from models.category import Category
+from utils.exceptions import NotFoundError
+
+
+@pytest.fixture
+def category(dynamodb_table):
+    """A stored category"""
+    return Category.create('Tools', 'Tools category description')
+
+
+class TestCategoryUpdate:
+    """Test class for Category.update"""
+
+    def test_no_op_update_returns_stored_category(self, category):
+        """Test an update with unchanged values leaves the category untouched"""
+        # Act
+        result = Category.update(category['category_id'], description='Tools category description')
+
+        # Assert
+        assert result['updated_at'] == category['updated_at']
+        assert Category.get(category['category_id'])['updated_at'] == category['updated_at']
+
+    def test_update_returns_new_category(self, category):
+        """Test a real change is written and returned"""
+        # Act
+        result = Category.update(category['category_id'], name='Hand Tools')
+
+        # Assert
+        assert result['name'] == 'Hand Tools'
+        assert result['GSI3SK'] == 'HAND TOOLS'
+        assert Category.get(category['category_id'])['name'] == 'Hand Tools'
+
+    def test_update_missing_category_raises_not_found(self, dynamodb_table):
+        """Test updating a missing ID raises NotFoundError and creates no item"""
+        # Act / Assert
+        with pytest.raises(NotFoundError, match="Category with ID 'missing' not found"):
+            Category.update('missing', description='Some description')
+        assert Category.get('missing') is None
+
+
+class TestCategoryDelete:
+    """Test class for Category.delete"""
+
+    def test_delete_removes_category(self, category):
+        """Test deleting an existing category reports success"""
+        # Act / Assert
+        assert Category.delete(category['category_id']) is True
+        assert Category.get(category['category_id']) is None
+
+    def test_delete_missing_category_returns_false(self, dynamodb_table):
+        """Test deleting a missing ID returns False and leaves no item behind"""
+        # Act / Assert
+        assert Category.delete('missing') is False
+        assert Category.get('missing') is None
+        assert Category.list_all()['items'] == []
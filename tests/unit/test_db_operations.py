@@ -0,0 +1,220 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from config.settings import TABLE_NAME
+from utils.db_operations import db_client, _BATCH_MAX_ATTEMPTS
+from utils.exceptions import DatabaseError, NotFoundError
+
+
+def _items(count):
+    return [{'PK': f'ITEM#{i:03d}', 'SK': 'ITEM', 'name': f'Item {i}'} for i in range(count)]
+
+
+class TestBatchWriteItems:
+    """Test class for DynamoDbClient.batch_write_items"""
+
+    def test_writes_in_chunks_of_25(self, dynamodb_table):
+        """Test 30 puts go out as a 25-item and a 5-item request and all land"""
+        # Arrange
+        spy = Mock(wraps=dynamodb_table.batch_write_item)
+
+        # Act
+        with patch.object(db_client.client, 'batch_write_item', spy):
+            db_client.batch_write_items(items_to_put=_items(30))
+
+        # Assert
+        chunk_sizes = [len(call.kwargs['RequestItems'][TABLE_NAME]) for call in spy.call_args_list]
+        assert chunk_sizes == [25, 5]
+        assert dynamodb_table.scan(TableName=TABLE_NAME, Select='COUNT')['Count'] == 30
+
+    @patch('utils.db_operations.time.sleep')
+    def test_retries_unprocessed_items(self, mock_sleep, monkeypatch):
+        """Test only the UnprocessedItems are resent"""
+        # Arrange
+        client = Mock()
+        monkeypatch.setattr(db_client, 'client', client)
+        leftover = {TABLE_NAME: [{'PutRequest': {'Item': {'PK': {'S': 'ITEM#000'}}}}]}
+        client.batch_write_item.side_effect = [{'UnprocessedItems': leftover}, {'UnprocessedItems': {}}]
+
+        # Act
+        db_client.batch_write_items(items_to_put=_items(3))
+
+        # Assert
+        assert client.batch_write_item.call_count == 2
+        assert client.batch_write_item.call_args.kwargs['RequestItems'] == leftover
+        mock_sleep.assert_called_once()
+
+    @patch('utils.db_operations.time.sleep')
+    def test_raises_when_items_stay_unprocessed(self, mock_sleep, monkeypatch):
+        """Test a chunk still throttled after the attempt limit raises DatabaseError"""
+        # Arrange
+        client = Mock()
+        monkeypatch.setattr(db_client, 'client', client)
+        leftover = {TABLE_NAME: [{'PutRequest': {'Item': {'PK': {'S': 'ITEM#000'}}}}]}
+        client.batch_write_item.return_value = {'UnprocessedItems': leftover}
+
+        # Act / Assert
+        with pytest.raises(DatabaseError, match='left unprocessed'):
+            db_client.batch_write_items(items_to_put=_items(1))
+        assert client.batch_write_item.call_count == _BATCH_MAX_ATTEMPTS
+
+
+class TestUpdateItemIfChanged:
+    """Test class for DynamoDbClient.update_item_if_changed"""
+
+    def setup_method(self):
+        """Setup method run before each test"""
+        self.fields = frozenset({'name', 'price'})
+
+    def test_no_op_returns_stored_item_unchanged(self, dynamodb_table):
+        """Test an update that changes no compared field leaves the item as is"""
+        # Arrange
+        db_client.put_item({'PK': 'ITEM#1', 'SK': 'ITEM', 'name': 'Hammer', 'price': 10, 'updated_at': 't0'})
+
+        # Act
+        item, changed = db_client.update_item_if_changed(
+            'ITEM#1', 'ITEM', {'name': 'Hammer', 'updated_at': 't1'}, self.fields
+        )
+
+        # Assert
+        assert changed is False
+        assert item['updated_at'] == 't0'
+        assert db_client.get_item('ITEM#1', 'ITEM')['updated_at'] == 't0'
+
+    def test_real_change_returns_new_item(self, dynamodb_table):
+        """Test a changed field is written and the new item returned"""
+        # Arrange
+        db_client.put_item({'PK': 'ITEM#1', 'SK': 'ITEM', 'name': 'Hammer', 'price': 10, 'updated_at': 't0'})
+
+        # Act
+        item, changed = db_client.update_item_if_changed(
+            'ITEM#1', 'ITEM', {'name': 'Hammer', 'price': 12, 'updated_at': 't1'}, self.fields
+        )
+
+        # Assert
+        assert changed is True
+        assert item['price'] == 12
+        assert item['updated_at'] == 't1'
+        assert db_client.get_item('ITEM#1', 'ITEM')['price'] == 12
+
+    def test_missing_item_raises_not_found(self, dynamodb_table):
+        """Test a missing key raises NotFoundError instead of reporting unchanged"""
+        # Act / Assert
+        with pytest.raises(NotFoundError):
+            db_client.update_item_if_changed('ITEM#1', 'ITEM', {'name': 'Hammer'}, self.fields)
+        assert db_client.get_item('ITEM#1', 'ITEM') is None
+
+
+class TestTransactWriteItems:
+    """Test class for DynamoDbClient.transact_write_items"""
+
+    def test_failed_condition_raises_not_found_and_writes_nothing(self, dynamodb_table):
+        """Test a ConditionalCheckFailed cancellation maps to NotFoundError and rolls back"""
+        # Act / Assert
+        with pytest.raises(NotFoundError):
+            db_client.transact_write_items(
+                items_to_put=[{'PK': 'ITEM#2', 'SK': 'ITEM', 'name': 'Saw'}],
+                items_to_delete=[{'pk': 'ITEM#1', 'sk': 'ITEM', 'condition_expression': 'attribute_exists(PK)'}]
+            )
+        assert db_client.get_item('ITEM#2', 'ITEM') is None
+
+    def test_puts_and_deletes_are_applied_together(self, dynamodb_table):
+        """Test a successful transaction applies every put and delete"""
+        # Arrange
+        db_client.put_item({'PK': 'ITEM#1', 'SK': 'ITEM', 'name': 'Hammer'})
+
+        # Act
+        db_client.transact_write_items(
+            items_to_put=[{'PK': 'ITEM#2', 'SK': 'ITEM', 'name': 'Saw'}],
+            items_to_delete=[{'pk': 'ITEM#1', 'sk': 'ITEM', 'condition_expression': 'attribute_exists(PK)'}]
+        )
+
+        # Assert
+        assert db_client.get_item('ITEM#1', 'ITEM') is None
+        assert db_client.get_item('ITEM#2', 'ITEM')['name'] == 'Saw'
+
+    def test_other_cancellation_reasons_raise_database_error(self, monkeypatch):
+        """Test a cancellation without a failed condition is not reported as not found"""
+        # Arrange
+        client = Mock()
+        monkeypatch.setattr(db_client, 'client', client)
+        client.transact_write_items.side_effect = ClientError({
+            'Error': {'Code': 'TransactionCanceledException', 'Message': 'Transaction cancelled'},
+            'CancellationReasons': [{'Code': 'None'}, {'Code': 'TransactionConflict'}]
+        }, 'TransactWriteItems')
+
+        # Act / Assert
+        with pytest.raises(DatabaseError, match='Failed to write transaction'):
+            db_client.transact_write_items(items_to_put=[{'PK': 'ITEM#1', 'SK': 'ITEM'}])
+
+    def test_other_client_errors_raise_database_error(self, monkeypatch):
+        """Test errors outside a cancellation surface as DatabaseError"""
+        # Arrange
+        client = Mock()
+        monkeypatch.setattr(db_client, 'client', client)
+        client.transact_write_items.side_effect = ClientError({
+            'Error': {'Code': 'ProvisionedThroughputExceededException', 'Message': 'Slow down'}
+        }, 'TransactWriteItems')
+
+        # Act / Assert
+        with pytest.raises(DatabaseError):
+            db_client.transact_write_items(items_to_put=[{'PK': 'ITEM#1', 'SK': 'ITEM'}])
+
+
+class TestBatchGetItems:
+    """Test class for DynamoDbClient.batch_get_items"""
+
+    @patch('utils.db_operations.time.sleep')
+    def test_retries_unprocessed_keys(self, mock_sleep, monkeypatch):
+        """Test UnprocessedKeys are resent and both responses are returned"""
+        # Arrange
+        client = Mock()
+        monkeypatch.setattr(db_client, 'client', client)
+        leftover = {TABLE_NAME: {'Keys': [{'PK': {'S': 'ITEM#001'}, 'SK': {'S': 'ITEM'}}]}}
+        client.batch_get_item.side_effect = [
+            {'Responses': {TABLE_NAME: [{'PK': {'S': 'ITEM#000'}, 'SK': {'S': 'ITEM'}}]},
+             'UnprocessedKeys': leftover},
+            {'Responses': {TABLE_NAME: [{'PK': {'S': 'ITEM#001'}, 'SK': {'S': 'ITEM'}}]},
+             'UnprocessedKeys': {}}
+        ]
+
+        # Act
+        items = db_client.batch_get_items([{'pk': f'ITEM#00{i}', 'sk': 'ITEM'} for i in range(2)])
+
+        # Assert
+        assert [item['PK'] for item in items] == ['ITEM#000', 'ITEM#001']
+        assert client.batch_get_item.call_args.kwargs['RequestItems'] == leftover
+        mock_sleep.assert_called_once()
+
+    @patch('utils.db_operations.time.sleep')
+    def test_raises_when_keys_stay_unprocessed(self, mock_sleep, monkeypatch):
+        """Test keys still unprocessed after the attempt limit raise DatabaseError"""
+        # Arrange
+        client = Mock()
+        monkeypatch.setattr(db_client, 'client', client)
+        leftover = {TABLE_NAME: {'Keys': [{'PK': {'S': 'ITEM#000'}, 'SK': {'S': 'ITEM'}}]}}
+        client.batch_get_item.return_value = {'Responses': {}, 'UnprocessedKeys': leftover}
+
+        # Act / Assert
+        with pytest.raises(DatabaseError, match='left unprocessed'):
+            db_client.batch_get_items([{'pk': 'ITEM#000', 'sk': 'ITEM'}])
+        assert client.batch_get_item.call_count == _BATCH_MAX_ATTEMPTS
+
+    def test_merges_results_across_chunks(self, dynamodb_table):
+        """Test 150 keys go out as 100- and 50-key requests and every item comes back"""
+        # Arrange
+        db_client.batch_write_items(items_to_put=_items(150))
+        keys = [{'pk': f'ITEM#{i:03d}', 'sk': 'ITEM'} for i in range(150)]
+        spy = Mock(wraps=dynamodb_table.batch_get_item)
+
+        # Act
+        with patch.object(db_client.client, 'batch_get_item', spy):
+            items = db_client.batch_get_items(keys, projection='PK, SK')
+
+        # Assert
+        chunk_sizes = [len(call.kwargs['RequestItems'][TABLE_NAME]['Keys']) for call in spy.call_args_list]
+        assert chunk_sizes == [100, 50]
+        assert sorted(item['PK'] for item in items) == [key['pk'] for key in keys]
+        assert all(set(item) == {'PK', 'SK'} for item in items)
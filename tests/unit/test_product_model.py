@@ -0,0 +1,407 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from config.settings import get_product_keys, get_product_list_keys
+from models import product as product_model
+from models.brand import Brand
+from models.category import Category
+from models.product import Product
+from services.product_service import ProductService
+from utils.db_operations import db_client
+from utils.exceptions import DatabaseError, NotFoundError, ValidationError
+
+
+# Attributes a product list response carries; storage keys are projected away
+LIST_RESPONSE_KEYS = {
+    'product_id', 'entity_type', 'name', 'brand_id', 'category_id', 'price',
+    'description', 'stock_quantity', 'images', 'created_at', 'updated_at'
+}
+
+# Well-formed ID that no stored brand or category has
+MISSING_ID = '00000000-0000-4000-8000-000000000000'
+
+
+@pytest.fixture
+def product(dynamodb_table):
+    """A stored product with its brand and category"""
+    brand = Brand.create('Acme', 'Acme brand description')
+    category = Category.create('Tools', 'Tools category description')
+    return Product.create('Hammer', brand['brand_id'], category['category_id'], 19.99,
+                          description='Claw hammer', stock_quantity=10,
+                          images=['https://example.com/hammer.jpg'])
+
+
+class TestProductListShape:
+    """Test class for the attributes returned by the product list queries"""
+
+    def test_list_all_returns_public_attributes(self, product):
+        """Test list_all rows carry the public attributes and entity_type, not storage keys"""
+        # Act
+        items = Product.list_all()['items']
+
+        # Assert
+        assert len(items) == 1
+        assert set(items[0]) == LIST_RESPONSE_KEYS
+        assert items[0]['product_id'] == product['product_id']
+
+    def test_list_by_brand_rows_are_distinguishable(self, product):
+        """Test the product row and its list row can be told apart by entity_type"""
+        # Act
+        items = Product.list_by_brand(product['brand_id'])['items']
+
+        # Assert
+        assert all(set(item) == LIST_RESPONSE_KEYS for item in items)
+        assert sorted(item['entity_type'] for item in items) == ['product', 'product_list']
+        assert {item['product_id'] for item in items} == {product['product_id']}
+
+    def test_list_by_category_returns_public_attributes(self, product):
+        """Test list_by_category rows carry the same shape as list_all"""
+        # Act
+        items = Product.list_by_category(product['category_id'])['items']
+
+        # Assert
+        assert items
+        assert all(set(item) == LIST_RESPONSE_KEYS for item in items)
+
+
+def _list_row(product_id):
+    return db_client.get_item(*get_product_list_keys(product_id))
+
+
+class TestProductCreateDelete:
+    """Test class for the transactional Product.create and Product.delete"""
+
+    def test_create_writes_product_and_list_row(self, product):
+        """Test create stores both the product and its list row"""
+        # Act
+        stored = Product.get(product['product_id'])
+        list_row = _list_row(product['product_id'])
+
+        # Assert
+        assert stored['entity_type'] == 'product'
+        assert list_row['entity_type'] == 'product_list'
+        assert list_row['name'] == stored['name']
+
+    def test_failed_create_writes_neither_row(self, dynamodb_table, monkeypatch):
+        """Test a cancelled create transaction leaves no partial product behind"""
+        # Arrange
+        brand = Brand.create('Acme', 'Acme brand description')
+        category = Category.create('Tools', 'Tools category description')
+        monkeypatch.setattr(Product, '_generate_id', staticmethod(lambda: 'fixed-id'))
+        real_transact = dynamodb_table.transact_write_items
+
+        def failing_transact(TransactItems):
+            # Cancel on the list row so the product row would be written alone if not atomic
+            TransactItems[1]['Put']['ConditionExpression'] = 'attribute_exists(PK)'
+            return real_transact(TransactItems=TransactItems)
+
+        monkeypatch.setattr(dynamodb_table, 'transact_write_items', failing_transact)
+
+        # Act / Assert
+        with pytest.raises(NotFoundError):
+            Product.create('Hammer', brand['brand_id'], category['category_id'], 19.99)
+        assert Product.get('fixed-id') is None
+        assert _list_row('fixed-id') is None
+
+    def test_delete_removes_both_rows(self, product):
+        """Test delete removes the product and its list row"""
+        # Act
+        deleted = Product.delete(product['product_id'])
+
+        # Assert
+        assert deleted is True
+        assert Product.get(product['product_id']) is None
+        assert _list_row(product['product_id']) is None
+
+    def test_delete_missing_product_returns_false(self, dynamodb_table):
+        """Test deleting a missing ID returns False and creates no item"""
+        # Act / Assert
+        assert Product.delete('missing') is False
+        assert Product.get('missing') is None
+        assert _list_row('missing') is None
+
+    def test_failed_delete_leaves_list_row(self, product):
+        """Test a delete cancelled by the existence condition removes neither row"""
+        # Arrange: the product row is gone but its list row lingers
+        db_client.delete_item(*get_product_keys(product['product_id']), return_values='NONE')
+
+        # Act
+        deleted = Product.delete(product['product_id'])
+
+        # Assert
+        assert deleted is False
+        assert _list_row(product['product_id']) is not None
+
+
+class TestProductUpdate:
+    """Test class for Product.update and Product.set_stock"""
+
+    def test_no_op_update_returns_stored_product(self, product):
+        """Test an update with unchanged values skips both writes"""
+        # Arrange
+        list_row = _list_row(product['product_id'])
+
+        # Act
+        result = Product.update(product['product_id'], name='Hammer', price=19.99)
+
+        # Assert
+        assert result['updated_at'] == product['updated_at']
+        assert _list_row(product['product_id']) == list_row
+
+    def test_update_writes_product_and_list_row(self, product):
+        """Test a real change returns the new product and is mirrored to the list row"""
+        # Act
+        result = Product.update(product['product_id'], name='Sledgehammer')
+
+        # Assert
+        assert result['name'] == 'Sledgehammer'
+        list_row = _list_row(product['product_id'])
+        assert list_row['name'] == 'Sledgehammer'
+        assert list_row['GSI3SK'] == 'SLEDGEHAMMER'
+        assert list_row['GSI3PK'] == 'PRODUCT_LIST'
+
+    def test_update_missing_product_raises_not_found(self, dynamodb_table):
+        """Test updating a missing ID raises NotFoundError and creates no item"""
+        # Act / Assert
+        with pytest.raises(NotFoundError, match="Product with ID 'missing' not found"):
+            Product.update('missing', name='Hammer')
+        assert Product.get('missing') is None
+        assert _list_row('missing') is None
+
+    def test_update_missing_product_leaves_table_empty(self, dynamodb_table):
+        """Test a failed update writes no partial item, including the GSI3 key"""
+        # Arrange
+        category = Category.create('Tools', 'Tools category description')
+
+        # Act / Assert
+        with pytest.raises(NotFoundError):
+            Product.update('missing', category_id=category['category_id'], price=5.0)
+        assert Product.list_by_category(category['category_id'])['items'] == []
+        assert Product.list_all()['items'] == []
+
+    def test_set_stock_no_op_returns_stored_product(self, product):
+        """Test setting the current stock value changes nothing"""
+        # Arrange
+        list_row = _list_row(product['product_id'])
+
+        # Act
+        result = Product.set_stock(product['product_id'], 10)
+
+        # Assert
+        assert result['updated_at'] == product['updated_at']
+        assert _list_row(product['product_id']) == list_row
+
+    def test_set_stock_writes_product_and_list_row(self, product):
+        """Test a new stock value is returned and mirrored to the list row"""
+        # Act
+        result = Product.set_stock(product['product_id'], 25)
+
+        # Assert
+        assert result['stock_quantity'] == 25
+        assert _list_row(product['product_id'])['stock_quantity'] == 25
+
+    def test_set_stock_missing_product_raises_not_found(self, dynamodb_table):
+        """Test setting stock on a missing ID raises NotFoundError and creates no item"""
+        # Act / Assert
+        with pytest.raises(NotFoundError):
+            Product.set_stock('missing', 5)
+        assert Product.get('missing') is None
+
+
+class TestProductAdjustStock:
+    """Test class for Product.adjust_stock"""
+
+    def test_adjust_stock_updates_product_and_list_row(self, product):
+        """Test a relative change is applied atomically and mirrored to the list row"""
+        # Act
+        result = Product.adjust_stock(product['product_id'], -4)
+
+        # Assert
+        assert result['stock_quantity'] == 6
+        list_row = _list_row(product['product_id'])
+        assert list_row['stock_quantity'] == 6
+        assert list_row['updated_at'] == result['updated_at']
+
+    def test_adjust_stock_below_zero_is_rejected(self, product):
+        """Test an adjustment below zero raises ValidationError and leaves stock alone"""
+        # Act / Assert
+        with pytest.raises(ValidationError, match='cannot be negative'):
+            Product.adjust_stock(product['product_id'], -11)
+        assert Product.get(product['product_id'])['stock_quantity'] == 10
+        assert _list_row(product['product_id'])['stock_quantity'] == 10
+
+    def test_adjust_stock_above_maximum_is_rejected(self, product):
+        """Test an adjustment past 999,999 raises ValidationError and leaves stock alone"""
+        # Act / Assert
+        with pytest.raises(ValidationError, match='cannot exceed 999,999'):
+            Product.adjust_stock(product['product_id'], 999990)
+        assert Product.get(product['product_id'])['stock_quantity'] == 10
+
+    def test_adjust_stock_up_to_maximum_is_allowed(self, product):
+        """Test the bounds are inclusive"""
+        # Act
+        result = Product.adjust_stock(product['product_id'], 999989)
+
+        # Assert
+        assert result['stock_quantity'] == 999999
+
+    def test_adjust_stock_missing_product_raises_not_found(self, dynamodb_table):
+        """Test adjusting a missing ID raises NotFoundError and creates no item"""
+        # Act / Assert
+        with pytest.raises(NotFoundError, match="Product with ID 'missing' not found"):
+            Product.adjust_stock('missing', 5)
+        assert Product.get('missing') is None
+        assert _list_row('missing') is None
+
+
+@patch('models.product.db_client')
+class TestExistsCache:
+    """Test class for the brand/category existence cache"""
+
+    def setup_method(self):
+        """Setup method run before each test"""
+        self.cache = {}
+
+    @patch('models.product.time.monotonic')
+    def test_hit_is_served_from_cache_until_ttl_expires(self, mock_monotonic, mock_db):
+        """Test a confirmed ID skips DynamoDB within the TTL and is re-checked after it"""
+        # Arrange
+        mock_db.check_item_exists.return_value = True
+        mock_monotonic.return_value = 100.0
+
+        # Act / Assert
+        assert product_model._cached_exists(self.cache, 'b1', 'BRAND#b1', 'BRAND')
+        mock_monotonic.return_value = 100.0 + product_model._EXISTS_CACHE_TTL - 1
+        assert product_model._cached_exists(self.cache, 'b1', 'BRAND#b1', 'BRAND')
+        assert mock_db.check_item_exists.call_count == 1
+
+        mock_monotonic.return_value = 100.0 + product_model._EXISTS_CACHE_TTL + 1
+        mock_db.check_item_exists.return_value = False
+        assert not product_model._cached_exists(self.cache, 'b1', 'BRAND#b1', 'BRAND')
+        assert mock_db.check_item_exists.call_count == 2
+        assert 'b1' not in self.cache
+
+    def test_missing_ids_are_not_cached(self, mock_db):
+        """Test a negative result is re-checked so a newly created ID is seen at once"""
+        # Arrange
+        mock_db.check_item_exists.side_effect = [False, True]
+
+        # Act / Assert
+        assert not product_model._cached_exists(self.cache, 'b1', 'BRAND#b1', 'BRAND')
+        assert self.cache == {}
+        assert product_model._cached_exists(self.cache, 'b1', 'BRAND#b1', 'BRAND')
+        assert mock_db.check_item_exists.call_count == 2
+
+    def test_oldest_entry_is_evicted_at_maxsize(self, mock_db, monkeypatch):
+        """Test a full cache drops its oldest entry to make room"""
+        # Arrange
+        monkeypatch.setattr(product_model, '_EXISTS_CACHE_MAXSIZE', 2)
+        mock_db.check_item_exists.return_value = True
+
+        # Act
+        for key in ('b1', 'b2', 'b3'):
+            product_model._cached_exists(self.cache, key, f'BRAND#{key}', 'BRAND')
+
+        # Assert
+        assert list(self.cache) == ['b2', 'b3']
+
+
+class TestProductBulkCreate:
+    """Test class for the bulk product import (ProductService.bulk_create_products)"""
+
+    @pytest.fixture(autouse=True)
+    def setup_catalog(self, dynamodb_table):
+        """Store the brand and category the imported products reference"""
+        self.table = dynamodb_table
+        self.brand = Brand.create('Acme', 'Acme brand description')
+        self.category = Category.create('Tools', 'Tools category description')
+
+    def setup_products(self, count):
+        """Helper method to build valid product data for the import"""
+        return [
+            {'name': f'Product {i}', 'brand_id': self.brand['brand_id'],
+             'category_id': self.category['category_id'], 'price': 10 + i}
+            for i in range(count)
+        ]
+
+    def test_bulk_create_writes_product_and_list_rows(self):
+        """Test every product lands with its list row, returned in input order"""
+        # Arrange
+        products = self.setup_products(30)
+
+        # Act
+        created = ProductService.bulk_create_products(products)
+
+        # Assert
+        assert [product['name'] for product in created] == [product['name'] for product in products]
+        assert all(Product.get(product['product_id']) for product in created)
+        assert all(_list_row(product['product_id']) for product in created)
+        assert len(Product.list_all(limit=100)['items']) == 30
+
+    def test_bulk_create_unknown_brand_writes_nothing(self):
+        """Test an unknown brand ID fails the whole import before any write"""
+        # Arrange
+        products = self.setup_products(3)
+        products[1]['brand_id'] = MISSING_ID
+
+        # Act / Assert
+        with pytest.raises(NotFoundError, match=f"Brand with ID '{MISSING_ID}' not found"):
+            ProductService.bulk_create_products(products)
+        assert Product.list_all()['items'] == []
+
+    def test_bulk_create_unknown_category_writes_nothing(self):
+        """Test an unknown category ID fails the whole import before any write"""
+        # Arrange
+        products = self.setup_products(3)
+        products[2]['category_id'] = MISSING_ID
+
+        # Act / Assert
+        with pytest.raises(NotFoundError, match=f"Category with ID '{MISSING_ID}' not found"):
+            ProductService.bulk_create_products(products)
+        assert Product.list_all()['items'] == []
+
+    def test_bulk_create_invalid_product_writes_nothing(self):
+        """Test one invalid product fails the whole import before any write"""
+        # Arrange
+        products = self.setup_products(3)
+        products[1]['price'] = -5
+
+        # Act / Assert
+        with pytest.raises(ValidationError):
+            ProductService.bulk_create_products(products)
+        assert Product.list_all()['items'] == []
+
+    def test_bulk_create_rejects_empty_and_oversized_imports(self):
+        """Test the import size is bounded"""
+        # Act / Assert
+        with pytest.raises(ValidationError, match='At least one product'):
+            ProductService.bulk_create_products([])
+        with pytest.raises(ValidationError, match='At most 100 products'):
+            ProductService.bulk_create_products(self.setup_products(101))
+        with pytest.raises(ValidationError, match='JSON object'):
+            ProductService.bulk_create_products(['not-a-product'])
+
+    @patch('utils.db_operations.time.sleep')
+    def test_bulk_create_partial_failure_keeps_earlier_chunks(self, mock_sleep, monkeypatch):
+        """Test a chunk left unprocessed raises DatabaseError after the earlier chunks are written"""
+        # Arrange: the first 25-item chunk is written, the second stays throttled
+        products = self.setup_products(20)
+        real_batch_write = self.table.batch_write_item
+        calls = []
+
+        def throttled_batch_write(RequestItems):
+            calls.append(RequestItems)
+            if len(calls) == 1:
+                return real_batch_write(RequestItems=RequestItems)
+            return {'UnprocessedItems': RequestItems}
+
+        monkeypatch.setattr(self.table, 'batch_write_item', Mock(side_effect=throttled_batch_write))
+
+        # Act / Assert
+        with pytest.raises(DatabaseError, match='left unprocessed'):
+            ProductService.bulk_create_products(products)
+        stored = self.table.scan(TableName='products_catalog', Select='COUNT',
+                                 FilterExpression='begins_with(PK, :p)',
+                                 ExpressionAttributeValues={':p': {'S': 'PRODUCT'}})['Count']
+        assert stored == 25
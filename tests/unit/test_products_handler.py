@@ -254,6 +254,32 @@ class TestProductsHandler:
         assert "Brand with ID 'non-existent-brand' not found" in body['message']
         mock_product_service.create_product.assert_called_once_with(product_data)
 
+    @patch('handlers.products.ProductService')
+    def test_create_products_bulk_from_array_body(self, mock_product_service):
+        """Test POST /products with a JSON array body goes to the bulk import"""
+        # Arrange
+        products_data = [
+            {'name': 'Hammer', 'brand_id': 'brand-123', 'category_id': 'category-123', 'price': 19.99},
+            {'name': 'Saw', 'brand_id': 'brand-123', 'category_id': 'category-123', 'price': 24.99}
+        ]
+        created_products = [
+            {'product_id': f'product-{i}', **data} for i, data in enumerate(products_data)
+        ]
+        mock_product_service.bulk_create_products.return_value = created_products
+
+        event = self.create_api_gateway_event('POST', body=json.dumps(products_data))
+
+        # Act
+        response = lambda_handler(event, self.mock_context)
+
+        # Assert
+        assert response['statusCode'] == 201
+        body = json.loads(response['body'])
+        assert body['message'] == '2 products created successfully'
+        assert body['data'] == created_products
+        mock_product_service.bulk_create_products.assert_called_once_with(products_data)
+        mock_product_service.create_product.assert_not_called()
+
     @patch('handlers.products.ProductService')
     def test_create_product_invalid_json(self, mock_product_service):
         """Test POST /products with invalid JSON body"""
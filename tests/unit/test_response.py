@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+from utils.response import (
+    _DEFAULT_MESSAGE_BODIES, create_response, not_found_response, parse_json_body, success_response
+)
+
+
+class TestCreateResponse:
+    """Test class for the API Gateway response helpers"""
+
+    def test_default_headers_are_shared_and_read_only(self):
+        """Test responses share one headers dict that refuses mutation"""
+        first = success_response({'id': '1'})
+        second = not_found_response()
+
+        assert first['headers'] is second['headers']
+        with pytest.raises(TypeError):
+            first['headers']['X-Debug'] = 'leaked'
+        with pytest.raises(TypeError):
+            first['headers'].update({'Content-Type': 'text/plain'})
+
+        assert 'X-Debug' not in second['headers']
+        assert second['headers']['Content-Type'] == 'application/json'
+
+    def test_headers_are_a_json_serializable_dict(self):
+        """Test the headers survive the runtime's JSON encoding of the response"""
+        response = create_response(200, {'id': '1'})
+
+        assert isinstance(response['headers'], dict)
+        assert json.loads(json.dumps(response))['headers']['Access-Control-Allow-Origin'] == '*'
+
+    def test_extra_headers_are_merged(self):
+        """Test caller headers are added on top of the defaults"""
+        response = create_response(200, headers={'Cache-Control': 'no-store'})
+
+        assert response['headers']['Cache-Control'] == 'no-store'
+        assert response['headers']['Content-Type'] == 'application/json'
+        assert 'Cache-Control' not in create_response(200)['headers']
+
+
+class TestParseJsonBody:
+    """Test class for parse_json_body"""
+
+    def test_event_is_not_modified(self):
+        """Test parsing leaves the caller's event exactly as it was"""
+        event = {'body': '{"name":"Hammer"}', 'httpMethod': 'POST'}
+        original = dict(event)
+
+        assert parse_json_body(event) == {'name': 'Hammer'}
+        assert event == original
+
+    def test_each_call_reads_the_current_body(self):
+        """Test a changed body is parsed afresh rather than served from a stale cache"""
+        event = {'body': '{"name":"Hammer"}'}
+        parse_json_body(event)
+        event['body'] = '{"name":"Saw"}'
+
+        assert parse_json_body(event) == {'name': 'Saw'}
+
+
+class TestMessageBody:
+    """Test class for message-only response bodies"""
+
+    def test_default_messages_are_pre_encoded(self):
+        """Test a helper's default message reuses its pre-encoded body"""
+        response = not_found_response()
+
+        assert response['body'] is _DEFAULT_MESSAGE_BODIES['Not found']
+        assert json.loads(response['body']) == {'message': 'Not found'}
+
+    def test_interpolated_messages_are_not_retained(self):
+        """Test ID-bearing messages are encoded per call and never kept"""
+        response = not_found_response("Brand with ID 'abc' not found")
+
+        assert json.loads(response['body']) == {'message': "Brand with ID 'abc' not found"}
+        assert "Brand with ID 'abc' not found" not in _DEFAULT_MESSAGE_BODIES